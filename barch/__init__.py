@@ -5,6 +5,7 @@ from __future__ import annotations
 
 __all__ = (
     "Client",
+    "SyncClient",
     "Result",
     "Success",
     "Error",
@@ -17,6 +18,8 @@ __all__ = (
     "GenerateRoute",
     "HttpSuccessResponse",
     "HttpErrorResponse",
+    "ConnectorConfig",
+    "RetryPolicy",
     "Character",
     "Terrain",
     "BaseCharacter",
@@ -24,20 +27,128 @@ __all__ = (
     "CharacterInfo",
     "Image",
     "CharacterDetails",
+    "LazyCharacterDetails",
     "Stats",
     "CommonModel",
     "Skills",
     "Raid",
     "Raids",
     "Characters",
+    "BilingualCharacter",
+    "BilingualCharacterDetails",
     "Position",
     "Role",
     "Rarity",
+    "CacheEntry",
+    "BaseCache",
+    "ResponseCache",
+    "SQLiteCache",
+    "SharedCache",
+    "CharacterIndex",
+    "Not",
+    "CharacterTable",
+    "TokenBucket",
+    "RateLimiter",
+    "RequestTiming",
+    "TimingStats",
+    "Instrumentation",
+    "WarmupReport",
 )
 
-from .models import *
-from .services import *
-from .client import *
-from .result import *
-from .serializer import *
-from .enums import *
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import *
+    from .services import *
+    from .client import *
+    from .sync import *
+    from .result import *
+    from .serializer import *
+    from .enums import *
+    from .cache import *
+    from .index import *
+    from .table import *
+    from .ratelimit import *
+    from .timing import *
+
+_MODULES: dict[str, tuple[str, ...]] = {
+    ".client": ("Client",),
+    ".sync": ("SyncClient",),
+    ".result": ("Result", "Success", "Error"),
+    ".serializer": ("Serializer",),
+    ".services": ("HttpService", "CharacterService", "BaseService", "RaidService"),
+    ".models": (
+        "Route",
+        "GenerateRoute",
+        "HttpSuccessResponse",
+        "HttpErrorResponse",
+        "ConnectorConfig",
+        "RetryPolicy",
+        "Character",
+        "Terrain",
+        "BaseCharacter",
+        "TerrainDetails",
+        "CharacterInfo",
+        "Image",
+        "CharacterDetails",
+        "LazyCharacterDetails",
+        "Stats",
+        "CommonModel",
+        "Skills",
+        "Raid",
+        "Raids",
+        "Characters",
+        "BilingualCharacter",
+        "BilingualCharacterDetails",
+        "WarmupReport",
+    ),
+    ".enums": ("Position", "Role", "Rarity"),
+    ".cache": (
+        "CacheEntry",
+        "BaseCache",
+        "ResponseCache",
+        "SQLiteCache",
+        "SharedCache",
+    ),
+    ".index": ("CharacterIndex", "Not"),
+    ".table": ("CharacterTable",),
+    ".ratelimit": ("TokenBucket", "RateLimiter"),
+    ".timing": ("RequestTiming", "TimingStats", "Instrumentation"),
+}
+
+_EXPORTS: dict[str, str] = {
+    name: module for module, names in _MODULES.items() for name in names
+}
+"""The module of every exported name, imported on first access so `import barch` stays cheap."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+
+    elif not name.startswith("__"):
+        # the submodules, like `barch.endpoints`, are attributes once imported
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,752 @@
+"""Module for the response caches used by the HTTP service."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import functools
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping, TypeVar
+
+import attrs
+
+from barch.models import Route, HttpSuccessResponse
+from barch.serializer import _default_json_loads
+from barch import endpoints
+
+T = TypeVar("T")
+
+__all__ = ("CacheEntry", "BaseCache", "ResponseCache", "SQLiteCache", "SharedCache")
+
+
+@attrs.define()
+class CacheEntry:
+    """Represents a cached API response."""
+
+    response: HttpSuccessResponse
+    """The cached HTTP response."""
+
+    stored_at: float
+    """The unix timestamp at which the response was stored."""
+
+    expires_at: float
+    """The unix timestamp after which the response is no longer fresh."""
+
+    @property
+    def is_fresh(self) -> bool:
+        """Returns `True` if the entry has not expired yet."""
+
+        return time.time() < self.expires_at
+
+
+class BaseCache(abc.ABC):
+    """The base cache from which all the response caches inherit.
+
+    Args:
+        default_ttl: The time in seconds a response stays fresh when its route has no TTL configured.
+        ttls: The optional per route TTLs in seconds, merged over `endpoints.DEFAULT_TTLS`.
+        max_stale: The time in seconds an expired response is still served, while it is
+            refreshed in the background, see [`lookup`][barch.BaseCache.lookup]. Older
+            responses are never served. `0` disables serving expired responses.
+    """
+
+    __slots__ = (
+        "_default_ttl",
+        "_ttls",
+        "_max_stale",
+        "_hits",
+        "_stale_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        default_ttl: float = 300.0,
+        ttls: Mapping[Route, float] | None = None,
+        max_stale: float = 0.0,
+    ) -> None:
+        if max_stale < 0:
+            raise ValueError("max_stale must not be negative.")
+
+        self._default_ttl = default_ttl
+        self._ttls: dict[Route, float] = {**endpoints.DEFAULT_TTLS, **(ttls or {})}
+        self._max_stale = max_stale
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that returned a fresh response."""
+
+        return self._hits
+
+    @property
+    def stale_hits(self) -> int:
+        """The number of lookups that returned an expired response within the max staleness."""
+
+        return self._stale_hits
+
+    @property
+    def max_stale(self) -> float:
+        """The time in seconds an expired response is still served while it is refreshed."""
+
+        return self._max_stale
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that found no fresh response."""
+
+        return self._misses
+
+    @property
+    @abc.abstractmethod
+    def size(self) -> int:
+        """The number of responses currently stored."""
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether the cache is shared with other processes, which refresh its responses
+        one at a time, see [`acquire_lease`][barch.BaseCache.acquire_lease]."""
+
+        return False
+
+    def acquire_lease(self, key: str) -> bool:
+        """Try to become the single refresher of a response, for caches shared between
+        processes. A cache used by a single process always grants the lease.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+
+        Returns:
+            `True` if the lease was acquired, `False` if another process holds it.
+        """
+
+        return True
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired with [`acquire_lease`][barch.BaseCache.acquire_lease].
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+        """
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a cache operation for the HTTP service. The in-memory caches run it right
+        away, the caches doing I/O override it to run it off the event loop."""
+
+        return function(*args)
+
+    async def get_async(self, key: str) -> HttpSuccessResponse | None:
+        """Like [`get`][barch.BaseCache.get], without blocking the event loop."""
+
+        return await self._run(self.get, key)
+
+    async def lookup_async(self, key: str) -> CacheEntry | None:
+        """Like [`lookup`][barch.BaseCache.lookup], without blocking the event loop."""
+
+        return await self._run(self.lookup, key)
+
+    async def get_entry_async(self, key: str) -> CacheEntry | None:
+        """Like [`get_entry`][barch.BaseCache.get_entry], without blocking the event loop."""
+
+        return await self._run(self.get_entry, key)
+
+    async def set_async(
+        self, key: str, response: HttpSuccessResponse, ttl: float
+    ) -> None:
+        """Like [`set`][barch.BaseCache.set], without blocking the event loop."""
+
+        await self._run(self.set, key, response, ttl)
+
+    async def acquire_lease_async(self, key: str) -> bool:
+        """Like [`acquire_lease`][barch.BaseCache.acquire_lease], without blocking the event loop."""
+
+        return await self._run(self.acquire_lease, key)
+
+    async def release_lease_async(self, key: str) -> None:
+        """Like [`release_lease`][barch.BaseCache.release_lease], without blocking the event loop."""
+
+        await self._run(self.release_lease, key)
+
+    def get_ttl(self, route: Route) -> float:
+        """Get the TTL in seconds configured for the given route.
+
+        Args:
+            route: The endpoint route, one of the routes in `barch.endpoints`.
+
+        Returns:
+            The route TTL or the default TTL if the route has none configured.
+        """
+
+        return self._ttls.get(route, self._default_ttl)
+
+    def get(self, key: str) -> HttpSuccessResponse | None:
+        """Get a fresh response from the cache.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+
+        Returns:
+            The cached response or `None` if it is missing or expired.
+        """
+
+        entry = self.get_entry(key)
+
+        if entry is None or not entry.is_fresh:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+
+        return entry.response
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Get the entry of a fresh response, or of an expired response which is within the
+        max staleness and can be served while it is refreshed.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+
+        Returns:
+            The cache entry or `None` if there is no response which can be served.
+        """
+
+        entry = self.get_entry(key)
+
+        if entry is not None:
+            if entry.is_fresh:
+                self._hits += 1
+                return entry
+
+            if time.time() < entry.expires_at + self._max_stale:
+                self._stale_hits += 1
+                return entry
+
+        self._misses += 1
+
+        return None
+
+    @abc.abstractmethod
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get the stored entry of a response, fresh or expired, without counting a hit or miss.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+
+        Returns:
+            The cache entry or `None` if there is none.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, response: HttpSuccessResponse, ttl: float) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+            response: The successful response to store.
+            ttl: The time in seconds the response stays fresh.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, key: str) -> None:
+        """Remove a single response from the cache.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+        """
+
+    def clear(self) -> None:
+        """Remove all the responses and reset the hit and miss counters."""
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+
+class ResponseCache(BaseCache):
+    """An in-memory, size bounded LRU cache for successful API responses.
+
+    Args:
+        max_size: The maximum number of responses kept before the least recently used one is evicted.
+        default_ttl: The time in seconds a response stays fresh when its route has no TTL configured.
+        ttls: The optional per route TTLs in seconds, merged over `endpoints.DEFAULT_TTLS`.
+        max_stale: The time in seconds an expired response is still served, while it is
+            refreshed in the background. `0` disables serving expired responses.
+
+    ??? example
+
+        ```py
+        from barch import Client, ResponseCache, endpoints
+
+        cache = ResponseCache(max_size=512, ttls={endpoints.GET_RAIDS: 60})
+        client = Client(cache=cache)
+
+        result = await client.raid.get_raids()
+
+        print(cache.hits, cache.misses)
+
+        await client.close()
+        ```
+    """
+
+    __slots__ = ("_entries", "_max_size")
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        default_ttl: float = 300.0,
+        ttls: Mapping[Route, float] | None = None,
+        max_stale: float = 0.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        super().__init__(default_ttl, ttls, max_stale)
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._max_size = max_size
+
+    @property
+    def size(self) -> int:
+        """The number of responses currently stored."""
+
+        return len(self._entries)
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get the stored entry of a response, marking it as recently used."""
+
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key: str, response: HttpSuccessResponse, ttl: float) -> None:
+        """Store a response in the cache, evicting the least recently used one if full.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+            response: The successful response to store.
+            ttl: The time in seconds the response stays fresh.
+        """
+
+        now = time.time()
+
+        self._entries[key] = CacheEntry(response, now, now + ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single response from the cache."""
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the responses and reset the hit and miss counters."""
+
+        self._entries.clear()
+
+        super().clear()
+
+
+class SQLiteCache(BaseCache):
+    """A persistent cache which stores the raw response bodies with their fetch time and
+    validators in a SQLite database, so a new process starts with a warm cache.
+
+    The bodies are decoded on first use and kept decoded in memory afterwards. Expired
+    responses are kept, with their `ETag` and `Last-Modified` validators, until they are
+    replaced or evicted, so they only need to be revalidated.
+
+    The [`Client`][barch.Client] runs the database reads and writes on a dedicated
+    thread, so they never block the event loop.
+
+    Args:
+        path: The path of the database file, created if it does not exist.
+        max_size: The maximum number of responses kept before the oldest ones are evicted.
+        default_ttl: The time in seconds a response stays fresh when its route has no TTL configured.
+        ttls: The optional per route TTLs in seconds, merged over `endpoints.DEFAULT_TTLS`.
+        json_loads: The optional function decoding the stored bodies. Defaults to `orjson`
+            or `msgspec` if installed, else the standard library `json`.
+        max_stale: The time in seconds an expired response is still served, while it is
+            refreshed in the background. `0` disables serving expired responses.
+
+    ??? example
+
+        ```py
+        from barch import Client, SQLiteCache
+
+        cache = SQLiteCache("barch-cache.sqlite3")
+        client = Client(cache=cache)
+
+        result = await client.character.get_all_characters()
+
+        await client.close()
+        cache.close()
+        ```
+    """
+
+    __slots__ = (
+        "_connection",
+        "_max_size",
+        "_json_loads",
+        "_decoded",
+        "_lock",
+        "_executor",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_size: int = 4096,
+        default_ttl: float = 300.0,
+        ttls: Mapping[Route, float] | None = None,
+        json_loads: Callable[[bytes], Any] | None = None,
+        max_stale: float = 0.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        super().__init__(default_ttl, ttls, max_stale)
+
+        # the connection is used from the executor thread and from the caller's thread,
+        # the lock serializes them
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="barch-cache")
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )"""
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+        )
+        self._max_size = max_size
+        self._json_loads = json_loads or _default_json_loads()
+        self._decoded: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """The number of responses currently stored."""
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args)
+        )
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get the stored entry of a response, decoding its body if it is not in memory yet."""
+
+        with self._lock:
+            return self._get_entry(key)
+
+    def _get_entry(self, key: str) -> CacheEntry | None:
+        row = self._connection.execute(
+            "SELECT stored_at, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self._decoded.pop(key, None)
+            return None
+
+        stored_at, expires_at = row
+        entry = self._decoded.get(key)
+
+        if entry is None or entry.stored_at != stored_at:
+            # the body is only read when the entry in memory is missing or outdated
+            row = self._connection.execute(
+                "SELECT status, body, etag, last_modified, stored_at, expires_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self._decoded.pop(key, None)
+                return None
+
+            status, body, etag, last_modified, stored_at, expires_at = row
+            response = HttpSuccessResponse(
+                status,
+                "Success.",
+                self._json_loads(body),
+                body,
+                etag,
+                last_modified,
+            )
+            entry = CacheEntry(response, stored_at, expires_at)
+
+        else:
+            entry.expires_at = expires_at
+
+        self._remember(key, entry)
+
+        return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Keep a decoded entry in memory, evicting the least recently used one if full."""
+
+        self._decoded[key] = entry
+        self._decoded.move_to_end(key)
+
+        while len(self._decoded) > self._max_size:
+            self._decoded.popitem(last=False)
+
+    def set(self, key: str, response: HttpSuccessResponse, ttl: float) -> None:
+        """Store a response in the cache, evicting the oldest ones if full.
+
+        Responses without a raw body, which can not be persisted, are not stored.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+            response: The successful response to store.
+            ttl: The time in seconds the response stays fresh.
+        """
+
+        if response.body is None:
+            return
+
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status,
+                    response.body,
+                    response.etag,
+                    response.last_modified,
+                    now,
+                    now + ttl,
+                ),
+            )
+
+            count = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+            if count > self._max_size:
+                # the oldest responses are found through the stored_at index
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN"
+                    " (SELECT key FROM responses ORDER BY stored_at LIMIT ?)",
+                    (count - self._max_size,),
+                )
+
+            self._remember(key, CacheEntry(response, now, now + ttl))
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single response from the cache."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._decoded.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the responses and reset the hit and miss counters."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._decoded.clear()
+
+        super().clear()
+
+    def close(self) -> None:
+        """Wait for the pending reads and writes, then close the database connection."""
+
+        self._executor.shutdown(wait=True)
+
+        with self._lock:
+            self._connection.close()
+
+
+class SharedCache(SQLiteCache):
+    """A [`SQLiteCache`][barch.SQLiteCache] shared by the processes of a host, like the
+    workers of a server, so a response fetched by one process is served to all the others.
+
+    The database uses the WAL journal, so readers do not block the writer, and the
+    processes wait up to the busy timeout for each other's locks. A read or write which
+    still finds the database locked is skipped, the response is then fetched or simply
+    not stored, rather than failing the request. An expired or missing
+    response is refreshed by a single process at a time, holding a lease on its key,
+    while the others wait for the refreshed response. A lease expires on its own after
+    the lease timeout, so a process which dies while refreshing does not block the others.
+
+    Each process still decodes and deserializes the responses it serves once.
+
+    Args:
+        path: The path of the database file, created if it does not exist.
+        max_size: The maximum number of responses kept before the oldest ones are evicted.
+        default_ttl: The time in seconds a response stays fresh when its route has no TTL configured.
+        ttls: The optional per route TTLs in seconds, merged over `endpoints.DEFAULT_TTLS`.
+        json_loads: The optional function decoding the stored bodies. Defaults to `orjson`
+            or `msgspec` if installed, else the standard library `json`.
+        max_stale: The time in seconds an expired response is still served, while it is
+            refreshed in the background. `0` disables serving expired responses.
+        lease_timeout: The time in seconds after which the lease of a refreshing process
+            expires and another process can refresh the response.
+        busy_timeout: The time in seconds a read or write waits for the lock of another
+            process before it is skipped.
+
+    Raises:
+        ValueError: When the lease timeout is not positive or the busy timeout is negative.
+
+    ??? example
+
+        ```py
+        from barch import Client, SharedCache
+
+        # in every worker process
+        cache = SharedCache("/tmp/barch-cache.sqlite3")
+        client = Client(cache=cache)
+
+        result = await client.character.get_all_characters()
+
+        await client.close()
+        cache.close()
+        ```
+    """
+
+    __slots__ = ("_lease_timeout", "_owner")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_size: int = 4096,
+        default_ttl: float = 300.0,
+        ttls: Mapping[Route, float] | None = None,
+        json_loads: Callable[[bytes], Any] | None = None,
+        max_stale: float = 0.0,
+        lease_timeout: float = 30.0,
+        busy_timeout: float = 0.5,
+    ) -> None:
+        if lease_timeout <= 0:
+            raise ValueError("lease_timeout must be positive.")
+
+        if busy_timeout < 0:
+            raise ValueError("busy_timeout must not be negative.")
+
+        super().__init__(path, max_size, default_ttl, ttls, json_loads, max_stale)
+
+        self._connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )"""
+        )
+        self._lease_timeout = lease_timeout
+        self._owner = uuid.uuid4().hex
+
+    @property
+    def is_shared(self) -> bool:
+        """Always `True`, the responses are refreshed by one process at a time."""
+
+        return True
+
+    @property
+    def lease_timeout(self) -> float:
+        """The time in seconds after which the lease of a refreshing process expires."""
+
+        return self._lease_timeout
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get the stored entry of a response, `None` if the database stays locked."""
+
+        try:
+            return super().get_entry(key)
+
+        except sqlite3.OperationalError:
+            return None
+
+    def set(self, key: str, response: HttpSuccessResponse, ttl: float) -> None:
+        """Store a response in the cache, skipped if the database stays locked."""
+
+        try:
+            super().set(key, response, ttl)
+
+        except sqlite3.OperationalError:
+            pass
+
+    def acquire_lease(self, key: str) -> bool:
+        """Try to become the single refresher of a response. The lease is granted if no
+        other process holds it or its lease expired.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+
+        Returns:
+            `True` if the lease was acquired, `False` if another process holds it or the
+            database stays locked.
+        """
+
+        now = time.time()
+
+        try:
+            with self._lock:
+                cursor = self._connection.execute(
+                    "INSERT INTO leases VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE"
+                    " SET owner = excluded.owner, expires_at = excluded.expires_at"
+                    " WHERE leases.expires_at <= ?",
+                    (key, self._owner, now + self._lease_timeout, now),
+                )
+
+        except sqlite3.OperationalError:
+            return False
+
+        return cursor.rowcount == 1
+
+    def release_lease(self, key: str) -> None:
+        """Release a lease acquired with [`acquire_lease`][barch.SharedCache.acquire_lease].
+
+        A lease which can not be released because the database stays locked expires on
+        its own after the lease timeout.
+
+        Args:
+            key: The request key, see [`GenerateRoute.key`][barch.GenerateRoute.key].
+        """
+
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner)
+                )
+
+        except sqlite3.OperationalError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all the responses and leases and reset the hit and miss counters."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM leases")
+
+        super().clear()
@@ -1,19 +1,83 @@
 """This module has the client to connect to BlueArchive API."""
 
 from __future__ import annotations
-from barch import services, serializer
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+import asyncio
+import time
+
+from barch import services, serializer, endpoints
+from barch.cache import BaseCache
+from barch.ratelimit import RateLimiter
+from barch.timing import Instrumentation, RequestTiming, TimingStats
+from barch.models import (
+    ConnectorConfig,
+    RetryPolicy,
+    Route,
+    GenerateRoute,
+    HttpSuccessResponse,
+    HttpErrorResponse,
+    WarmupReport,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 __all__ = ("Client",)
 
 
 class Client:
-    """An asynchronous client used to interact with the BlueArchive API."""
+    """An asynchronous client used to interact with the BlueArchive API.
+
+    Args:
+        cache: The optional cache used to serve repeated requests, either the in-memory
+            [`ResponseCache`][barch.ResponseCache], the persistent [`SQLiteCache`][barch.SQLiteCache]
+            or the [`SharedCache`][barch.SharedCache] shared between processes.
+        connector: The optional [`ConnectorConfig`][barch.ConnectorConfig] with the connection
+            pool settings.
+        session: The optional existing `aiohttp.ClientSession` to make the requests with,
+            which is left open when the client is closed.
+        lazy: If `True`, the sub-models of `CharacterDetails` are only deserialized on first
+            access, see [`LazyCharacterDetails`][barch.LazyCharacterDetails].
+        json_loads: The optional function decoding the JSON response bodies from bytes.
+            Defaults to `orjson` or `msgspec` if installed, else the standard library `json`.
+        retry: The optional [`RetryPolicy`][barch.RetryPolicy] of all the routes. Without one,
+            failed requests are not retried.
+        route_retries: The optional retry policies of single routes from `barch.endpoints`,
+            overriding `retry`.
+        rate_limiter: The optional [`RateLimiter`][barch.RateLimiter] shared by all the requests
+            of the client.
+        instrumentation: The optional [`Instrumentation`][barch.Instrumentation] recording the
+            per phase timing of every call.
+
+    Raises:
+        ValueError: When both a connector and a session are given.
+    """
 
     __slots__ = ("_http", "_serializer", "_character", "_raid")
 
-    def __init__(self) -> None:
-        self._http = services.HttpService()
-        self._serializer = serializer.Serializer()
+    def __init__(
+        self,
+        cache: BaseCache | None = None,
+        connector: ConnectorConfig | None = None,
+        session: aiohttp.ClientSession | None = None,
+        lazy: bool = False,
+        json_loads: Callable[[bytes], Any] | None = None,
+        retry: RetryPolicy | None = None,
+        route_retries: Mapping[Route, RetryPolicy] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self._http = services.HttpService(
+            cache,
+            connector,
+            session,
+            json_loads,
+            retry,
+            route_retries,
+            rate_limiter,
+            instrumentation,
+        )
+        self._serializer = serializer.Serializer(lazy)
         self._character = services.CharacterService(self._http, self._serializer)
         self._raid = services.RaidService(self._http, self._serializer)
 
@@ -29,6 +93,167 @@ class Client:
 
         return self._raid
 
+    @property
+    def timings(self) -> dict[str, TimingStats]:
+        """The rolling timing statistics of every endpoint by uri template, empty without instrumentation."""
+
+        instrumentation = self._http.instrumentation
+
+        return instrumentation.stats if instrumentation else {}
+
+    @property
+    def last_timing(self) -> RequestTiming | None:
+        """The [`RequestTiming`][barch.RequestTiming] of the last call finished in the current task, if any."""
+
+        instrumentation = self._http.instrumentation
+
+        return instrumentation.last if instrumentation else None
+
+    async def warmup(
+        self,
+        concurrency: int = 10,
+        on_progress: Callable[[WarmupReport], Any] | None = None,
+        budget: float | None = None,
+    ) -> WarmupReport:
+        """Fill the cache with the EN and JP rosters and raids and then the character details
+        of every character of both rosters, so the service methods are served from the cache.
+
+        Responses which are still fresh in the cache are skipped, so calling it again after
+        the time budget ran out resumes where it stopped. Requests already sent when the
+        budget runs out still complete in the background and are cached.
+
+        Keyword Args:
+            concurrency: The maximum number of requests made at the same time, defaults to 10.
+            on_progress: The optional function called with the [`WarmupReport`][barch.WarmupReport]
+                after every response, on the event loop.
+            budget: The optional maximum time in seconds to spend, without limit by default.
+
+        Returns:
+            The [`WarmupReport`][barch.WarmupReport] with the number of fetched, skipped, failed
+                and remaining responses.
+
+        Raises:
+            ValueError: When the client has no cache or the concurrency is less than 1.
+
+        ??? example
+
+            ```py
+            from barch import Client, ResponseCache
+
+            client = Client(cache=ResponseCache(max_size=1024))
+
+            report = await client.warmup(
+                concurrency=20,
+                on_progress=lambda report: print(f"{report.done}/{report.total}"),
+                budget=60,
+            )
+
+            if not report.is_complete:
+                print(f"{report.remaining} characters left for the next warmup")
+
+            await client.close()
+            ```
+        """
+
+        if self._http.cache is None:
+            raise ValueError("A cache is required to warm up.")
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        start = time.perf_counter()
+        deadline = None if budget is None else start + budget
+        semaphore = asyncio.Semaphore(concurrency)
+        report = WarmupReport()
+
+        async def prefetch(
+            route: GenerateRoute,
+        ) -> HttpSuccessResponse | HttpErrorResponse | None:
+            async with semaphore:
+                response = await self._http.prefetch(route)
+
+            if response is None:
+                report.skipped += 1
+
+            elif isinstance(response, HttpErrorResponse):
+                report.failed += 1
+
+            else:
+                report.fetched += 1
+
+            report.elapsed = time.perf_counter() - start
+
+            if on_progress is not None:
+                on_progress(report)
+
+            return response
+
+        rosters = {
+            False: endpoints.GET_ALL_CHARACTERS.generate_route(),
+            True: endpoints.GET_ALL_CHARACTERS_JP.generate_route(),
+        }
+        routes = [
+            *rosters.values(),
+            endpoints.GET_RAIDS.generate_route(),
+            endpoints.GET_RAIDS_JP.generate_route(),
+        ]
+        report.total = len(routes)
+
+        if await self._prefetch_all(routes, prefetch, deadline):
+            details = [
+                endpoints.generate_character_route(id=id, is_jp=is_jp)
+                for is_jp, route in rosters.items()
+                for id in await self._roster_ids(route)
+            ]
+            report.total += len(details)
+            await self._prefetch_all(details, prefetch, deadline)
+
+        report.elapsed = time.perf_counter() - start
+
+        return report
+
+    async def _prefetch_all(
+        self,
+        routes: Iterable[GenerateRoute],
+        prefetch: Callable[[GenerateRoute], Any],
+        deadline: float | None,
+    ) -> bool:
+        """Internal method that prefetches routes until the deadline, cancelling the
+        prefetches which did not complete in time.
+
+        Returns:
+            Whether every prefetch completed before the deadline.
+        """
+
+        tasks = [asyncio.ensure_future(prefetch(route)) for route in routes]
+
+        if not tasks:
+            return True
+
+        timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        return not pending
+
+    async def _roster_ids(self, route: GenerateRoute) -> list[int]:
+        """Internal method that gets the character ids of a cached roster.
+
+        Returns:
+            The ids of the characters, empty if the roster is not cached.
+        """
+
+        entry = await self._http.cache.get_entry_async(route.key)
+
+        if entry is None:
+            return []
+
+        return [character["id"] for character in self._http.decode(entry.response)]
+
     async def close(self) -> None:
         """Close the existing client session.
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 from typing import Final
 
-from barch.models import Route
+from barch.models import GenerateRoute, Route
 
 BASEURL: Final[str] = "https://api.ennead.cc/buruaka"
 
@@ -23,3 +23,36 @@ GET_CHARACTER_QUERY: Final[Route] = Route("GET", f"{CHARACTERURL}/query")
 
 GET_RAIDS: Final[Route] = Route("GET", f"{RAIDURL}")
 GET_RAIDS_JP: Final[Route] = Route("GET", f"{RAIDURL}{JP_SUFFIX}")
+
+DEFAULT_TTLS: Final[dict[Route, float]] = {
+    GET_ALL_CHARACTERS: 3600.0,
+    GET_ALL_CHARACTERS_JP: 3600.0,
+    GET_CHARACTER: 3600.0,
+    GET_CHARACTER_JP: 3600.0,
+    GET_CHARACTER_QUERY: 3600.0,
+    GET_RAIDS: 3600.0,
+    GET_RAIDS_JP: 3600.0,
+}
+"""The default time in seconds a cached response of each route stays fresh. The raid
+responses expire earlier, at the next raid start, settle or end, see
+[`RaidService`][barch.RaidService]."""
+
+
+def generate_character_route(
+    name: str | None = None, id: int | None = None, is_jp: bool = False
+) -> GenerateRoute:
+    """Generate the route of a single character details request, by name or id.
+
+    Keyword Args:
+        name: The optional name of the character.
+        id: The optional id of the character, used in the path when no name is given.
+        is_jp: If `True`, the route of the JP version.
+
+    Returns:
+        The route of the character details.
+    """
+
+    route = GET_CHARACTER_JP if is_jp else GET_CHARACTER
+    params = {"id": "true"} if id else None
+
+    return route.generate_route(name if name else id).with_params(params)
@@ -0,0 +1,201 @@
+"""Module for the local character index which answers character queries offline."""
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Union
+
+from barch.models import Character, Characters
+
+__all__ = ("CharacterIndex", "Not")
+
+
+class Not:
+    """Negates a [`CharacterIndex`][barch.CharacterIndex] filter, matching the characters
+    which have none of the given values.
+
+    Args:
+        *values: The values to exclude.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, *values: Any) -> None:
+        self._values = values
+
+    @property
+    def values(self) -> tuple[Any, ...]:
+        """The excluded values."""
+
+        return self._values
+
+    def __repr__(self) -> str:
+        return f"Not{self._values!r}"
+
+
+FilterT = Union[Any, Iterable[Any], Not]
+
+_FIELDS: dict[str, str] = {
+    "role": "role",
+    "type": "squad_type",
+    "school": "school",
+    "position": "position",
+    "weapon": "weapon_type",
+    "damage": "bullet_type",
+    "armor": "armor_type",
+}
+"""The query parameters of `get_character_by_query` and the `Character` attributes they filter on."""
+
+
+def _normalize(value: Any) -> str:
+    """Normalize a filter or attribute value for case insensitive matching."""
+
+    return str(value).lower()
+
+
+class CharacterIndex:
+    """An in-memory index over the character roster, which answers the same filters as
+    [`get_character_by_query`][barch.CharacterService.get_character_by_query] without a
+    network round trip.
+
+    Every filter is an inverted index from value to a bitset of the matching characters,
+    so a query is a handful of integer `&` and `|` operations. The `club` filter is not
+    supported, as the roster has no club data.
+
+    Args:
+        characters: The characters to index, usually from
+            [`get_all_characters`][barch.CharacterService.get_all_characters].
+
+    ??? example
+
+        ```py
+        from barch import Client, CharacterIndex, Not, Role, Position
+
+        client = Client()
+
+        result = await client.character.get_all_characters()
+        index = CharacterIndex(result.value)
+
+        characters = index.query(
+            role=[Role.Dealer, Role.Support], position=Not(Position.Front)
+        )
+
+        await client.close()
+        ```
+    """
+
+    __slots__ = ("_characters", "_all", "_bitsets")
+
+    def __init__(self, characters: Iterable[Character]) -> None:
+        self._characters: list[Characters] = []
+        self._bitsets: dict[str, dict[str, int]] = {field: {} for field in _FIELDS}
+
+        for position, character in enumerate(characters):
+            self._characters.append(Characters(character.id, character.name))
+            bit = 1 << position
+
+            for field, attr in _FIELDS.items():
+                value = getattr(character, attr, None)
+
+                if value is not None:
+                    bitsets = self._bitsets[field]
+                    key = _normalize(value)
+                    bitsets[key] = bitsets.get(key, 0) | bit
+
+        self._all = (1 << len(self._characters)) - 1
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def values(self, field: str) -> list[str]:
+        """Get the distinct values of a filter field, lower cased.
+
+        Args:
+            field: The filter field, one of the keyword arguments of [`query`][barch.CharacterIndex.query].
+
+        Returns:
+            The distinct values present in the index.
+
+        Raises:
+            KeyError: When the field is not a filter field.
+        """
+
+        return sorted(self._bitsets[field])
+
+    def _match(self, field: str, filter: FilterT) -> int:
+        """Get the bitset of the characters matching a single filter."""
+
+        negate = isinstance(filter, Not)
+        values = filter.values if negate else filter
+
+        if isinstance(values, str) or not isinstance(values, Iterable):
+            values = (values,)
+
+        bitsets = self._bitsets[field]
+        mask = 0
+
+        for value in values:
+            mask |= bitsets.get(_normalize(value), 0)
+
+        return self._all & ~mask if negate else mask
+
+    def _members(self, mask: int) -> Iterator[Characters]:
+        """Yield the characters of a bitset in roster order."""
+
+        while mask:
+            low = mask & -mask
+            yield self._characters[low.bit_length() - 1]
+            mask ^= low
+
+    def query(
+        self,
+        role: FilterT | None = None,
+        type: FilterT | None = None,
+        school: FilterT | None = None,
+        position: FilterT | None = None,
+        weapon: FilterT | None = None,
+        damage: FilterT | None = None,
+        armor: FilterT | None = None,
+    ) -> list[Characters]:
+        """Get the characters matching all the given filters.
+        Atleast one filter must be specified. Every filter takes a single value, a collection
+        of values matching any of them, or [`Not`][barch.Not] to exclude values.
+        Values are matched case insensitively.
+
+        Keyword Args:
+            role: The optional role filter, with `Role` enums or strings.
+            type: The optional squad type filter.
+            school: The optional school filter.
+            position: The optional position filter, with `Position` enums or strings.
+            weapon: The optional weapon type filter.
+            damage: The optional bullet type filter.
+            armor: The optional armor type filter.
+
+        Returns:
+            The matching `Characters` in roster order.
+
+        Raises:
+            ValueError: When no filters are given.
+        """
+
+        filters = {
+            "role": role,
+            "type": type,
+            "school": school,
+            "position": position,
+            "weapon": weapon,
+            "damage": damage,
+            "armor": armor,
+        }
+
+        if all(filter is None for filter in filters.values()):
+            raise ValueError("Atleast one parameter must be specified.")
+
+        mask = self._all
+
+        for field, filter in filters.items():
+            if filter is not None:
+                mask &= self._match(field, filter)
+
+                if not mask:
+                    break
+
+        return list(self._members(mask))
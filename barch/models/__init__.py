@@ -7,6 +7,8 @@ __all__ = (
     "GenerateRoute",
     "HttpSuccessResponse",
     "HttpErrorResponse",
+    "ConnectorConfig",
+    "RetryPolicy",
     "Character",
     "Terrain",
     "BaseCharacter",
@@ -14,12 +16,16 @@ __all__ = (
     "CharacterInfo",
     "Image",
     "CharacterDetails",
+    "LazyCharacterDetails",
     "Stats",
     "CommonModel",
     "Skills",
     "Characters",
+    "BilingualCharacter",
+    "BilingualCharacterDetails",
     "Raid",
     "Raids",
+    "WarmupReport",
 )
 
 
@@ -27,3 +33,4 @@ from .route import *
 from .http import *
 from .character import *
 from .raid import *
+from .warmup import *
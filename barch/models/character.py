@@ -1,7 +1,7 @@
 """Module for Character model."""
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable, Mapping
 
 from .base import BaseModel
 from barch.enums import Position, Role, Rarity
@@ -16,10 +16,13 @@ __all__ = (
     "CharacterInfo",
     "Image",
     "CharacterDetails",
+    "LazyCharacterDetails",
     "Stats",
     "CommonModel",
     "Skills",
     "Characters",
+    "BilingualCharacter",
+    "BilingualCharacterDetails",
 )
 
 
@@ -65,6 +68,9 @@ class Character(BaseCharacter):
     id: int
     """Id of the character."""
 
+    is_released: bool
+    """Whether the character is released in the version of the roster."""
+
     school: str
     """The school to which the character belongs to."""
 
@@ -136,6 +142,78 @@ class CharacterDetails(BaseModel):
     skills: Skills
 
 
+class _LazyField:
+    """Descriptor that deserializes a sub-model on first access and stores it in the model slot."""
+
+    __slots__ = ("_name", "_slot")
+
+    def __init__(self, name: str, slot: Any) -> None:
+        self._name = name
+        self._slot = slot
+
+    def __get__(self, instance: LazyCharacterDetails | None, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return self._slot.__get__(instance, owner)
+
+        except AttributeError:
+            value = instance._loaders[self._name](instance._raw.get(self._name, {}))
+            self._slot.__set__(instance, value)
+
+            return value
+
+    def __set__(self, instance: LazyCharacterDetails, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
+class LazyCharacterDetails(CharacterDetails):
+    """Represents Character Details model which keeps the raw payload and deserializes each
+    sub-model only on first access, caching it on the instance.
+
+    It equals any `CharacterDetails` with the same field values, eager or lazy, comparing
+    deserializes the sub-models not accessed yet.
+
+    Args:
+        raw: The raw JSON payload of the character details.
+        loaders: The functions deserializing each sub-model from its part of the raw payload,
+            by field name.
+    """
+
+    __slots__ = ("_raw", "_loaders")
+
+    def __init__(
+        self,
+        raw: dict[str, Any],
+        loaders: Mapping[str, Callable[[dict[str, Any]], Any]],
+    ) -> None:
+        self._raw = raw
+        self._loaders = loaders
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CharacterDetails):
+            return NotImplemented
+
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in attrs.fields(CharacterDetails)
+        )
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+
+for _name in ("character", "info", "image", "stat", "terrain", "skills"):
+    setattr(
+        LazyCharacterDetails,
+        _name,
+        _LazyField(_name, CharacterDetails.__dict__[_name]),
+    )
+
+
 @attrs.define(init=False)
 class Terrain(BaseModel):
     """Represents Terrain model."""
@@ -228,3 +306,55 @@ class Characters(BaseModel):
     id: int
 
     name: str
+
+
+@attrs.define
+class BilingualCharacter(BaseModel):
+    """Represents a character of both the EN and JP versions, joined by id."""
+
+    id: int
+    """Id of the character."""
+
+    en: Character | None = attrs.field(default=None)
+    """The EN version of the character, `None` if it is not in the EN roster."""
+
+    jp: Character | None = attrs.field(default=None)
+    """The JP version of the character, `None` if it is not in the JP roster."""
+
+    @property
+    def is_released_en(self) -> bool:
+        """Whether the character is released in the EN version, `False` if it is not in the EN roster."""
+
+        return self.en is not None and bool(self.en.is_released)
+
+    @property
+    def is_released_jp(self) -> bool:
+        """Whether the character is released in the JP version, `False` if it is not in the JP roster."""
+
+        return self.jp is not None and bool(self.jp.is_released)
+
+
+@attrs.define
+class BilingualCharacterDetails(BaseModel):
+    """Represents the character details of both the EN and JP versions, joined by id."""
+
+    id: int
+    """Id of the character."""
+
+    en: CharacterDetails | None = attrs.field(default=None)
+    """The EN version of the character details, `None` if the character is not in the EN version."""
+
+    jp: CharacterDetails | None = attrs.field(default=None)
+    """The JP version of the character details, `None` if the character is not in the JP version."""
+
+    @property
+    def is_released_en(self) -> bool:
+        """Whether the character is released in the EN version."""
+
+        return self.en is not None and bool(self.en.is_released)
+
+    @property
+    def is_released_jp(self) -> bool:
+        """Whether the character is released in the JP version."""
+
+        return self.jp is not None and bool(self.jp.is_released)
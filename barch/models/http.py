@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from typing import Any
+import random
+
 import attrs
 
 from .base import BaseModel
 
-__all__ = ("HttpSuccessResponse", "HttpErrorResponse")
+__all__ = ("HttpSuccessResponse", "HttpErrorResponse", "ConnectorConfig", "RetryPolicy")
 
 
 @attrs.define()
@@ -23,6 +25,21 @@ class HttpSuccessResponse(BaseModel):
     data: Any
     """The JSON API response."""
 
+    body: bytes | None = attrs.field(default=None, repr=False)
+    """The raw response body."""
+
+    etag: str | None = attrs.field(default=None)
+    """The `ETag` validator of the response, if any."""
+
+    last_modified: str | None = attrs.field(default=None)
+    """The `Last-Modified` validator of the response, if any."""
+
+    deserialized: dict[tuple[Any, str], Any] = attrs.field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+    """The models deserialized from the data by serializer and kind of models, reused when
+    the same response is served again from the cache or after a `304 Not Modified`."""
+
 
 @attrs.define()
 class HttpErrorResponse(BaseModel):
@@ -33,3 +50,70 @@ class HttpErrorResponse(BaseModel):
 
     message: str
     """The error response message."""
+
+    retry_after: float | None = attrs.field(default=None)
+    """The time in seconds the API asked to wait before retrying, from `Retry-After`."""
+
+    attempts: int = attrs.field(default=1)
+    """The number of attempts made before giving up."""
+
+    elapsed: float = attrs.field(default=0.0)
+    """The total time in seconds spent on all the attempts, including the backoff delays."""
+
+
+@attrs.define()
+class ConnectorConfig(BaseModel):
+    """Represents the connection pool settings used by the HTTP service."""
+
+    limit: int = 100
+    """The maximum number of simultaneous connections, `0` for no limit."""
+
+    limit_per_host: int = 0
+    """The maximum number of simultaneous connections to a single host, `0` for no limit."""
+
+    keepalive_timeout: float = 15.0
+    """The time in seconds an idle connection is kept open for reuse."""
+
+    ttl_dns_cache: int | None = 10
+    """The time in seconds resolved DNS entries are cached, `None` to cache them forever."""
+
+
+@attrs.define()
+class RetryPolicy(BaseModel):
+    """Represents the retry policy of the HTTP service, an exponential backoff with jitter."""
+
+    max_attempts: int = 3
+    """The maximum number of attempts, including the first one."""
+
+    base_delay: float = 0.5
+    """The backoff delay in seconds before the first retry, doubled for every next retry."""
+
+    max_delay: float = 30.0
+    """The maximum backoff delay in seconds. A longer `Retry-After` is not waited for."""
+
+    jitter: bool = True
+    """If `True`, a random delay between zero and the backoff delay is used."""
+
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """The error statuses that are retried, connection errors are reported as `500`."""
+
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    """The idempotent HTTP methods that are retried."""
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Get the time to wait before the next attempt.
+
+        Args:
+            attempt: The number of the attempt that just failed, starting at 1.
+            retry_after: The optional `Retry-After` of the failed attempt, in seconds.
+
+        Returns:
+            The delay in seconds, or `None` if the `Retry-After` is longer than `max_delay`.
+        """
+
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+        return random.uniform(0, delay) if self.jitter else delay
@@ -9,15 +9,29 @@ import attrs
 __all__ = ("Route", "GenerateRoute")
 
 
-@attrs.define
+@attrs.frozen
 class Route:
-    """The route model."""
+    """The route model.
+
+    Routes are immutable, the uri is compiled into a template once and every call to
+    [`generate_route`][barch.Route.generate_route] returns a new
+    [`GenerateRoute`][barch.GenerateRoute].
+    """
 
     method: str
     """The http method of request."""
 
     uri: str
-    """The request uri."""
+    """The request uri, with `()` as placeholders for the route arguments."""
+
+    _template: str = attrs.field(init=False, repr=False, eq=False)
+
+    _placeholders: int = attrs.field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        escaped = self.uri.replace("{", "{{").replace("}", "}}")
+        object.__setattr__(self, "_template", escaped.replace("()", "{}"))
+        object.__setattr__(self, "_placeholders", self.uri.count("()"))
 
     def generate_route(self, *args: str | int) -> GenerateRoute:
         """Method to create a route with all the necessary data.
@@ -25,19 +39,21 @@ class Route:
         Args:
             *args: the arguments to insert."""
 
-        generated_route = GenerateRoute(self)
+        if not self._placeholders:
+            return GenerateRoute(self)
 
-        for arg in args:
-            generated_route.uri = generated_route.uri.replace(r"()", str(arg), 1)
+        if len(args) < self._placeholders:
+            args = (*args, *("()",) * (self._placeholders - len(args)))
 
-        return generated_route
+        return GenerateRoute(self, self._template.format(*args))
 
 
 class GenerateRoute:
-    __slots__ = ("_route", "_params", "_data")
+    __slots__ = ("_route", "_uri", "_params", "_data")
 
-    def __init__(self, route: Route) -> None:
+    def __init__(self, route: Route, uri: str | None = None) -> None:
         self._route = route
+        self._uri = route.uri if uri is None else uri
         self._params: dict[str, str | int] = {}
         self._data: dict[str, str | int] = {}
 
@@ -49,18 +65,24 @@ class GenerateRoute:
     @property
     def uri(self) -> str:
         """The routes uri endpoint."""
-        return self.route.uri
+        return self._uri
 
     @uri.setter
     def uri(self, val: str) -> str:
         """Set the uri."""
-        self.route.uri = val
+        self._uri = val
 
     @property
     def method(self) -> str:
         """The routes method, i.e. GET, POST..."""
         return self.route.method
 
+    @property
+    def key(self) -> str:
+        """The key identifying this request by its method, uri and query params."""
+        params = "&".join(f"{k}={v}" for k, v in sorted(self._params.items()))
+        return f"{self.method} {self.uri} {params}"
+
     @property
     def params(self) -> dict[str, str | int]:
         """The query params for the route."""
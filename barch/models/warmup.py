@@ -0,0 +1,47 @@
+"""Module for the warmup report model."""
+
+from __future__ import annotations
+
+import attrs
+
+from .base import BaseModel
+
+__all__ = ("WarmupReport",)
+
+
+@attrs.define()
+class WarmupReport(BaseModel):
+    """Represents the progress of a cache warmup, see [`Client.warmup`][barch.Client.warmup]."""
+
+    total: int = 0
+    """The number of responses to warm up known so far, which grows once the rosters are fetched."""
+
+    fetched: int = 0
+    """The number of responses fetched and stored in the cache."""
+
+    skipped: int = 0
+    """The number of responses skipped because the cache already had them fresh."""
+
+    failed: int = 0
+    """The number of requests which failed."""
+
+    elapsed: float = 0.0
+    """The time in seconds spent so far."""
+
+    @property
+    def done(self) -> int:
+        """The number of responses fetched, skipped or failed."""
+
+        return self.fetched + self.skipped + self.failed
+
+    @property
+    def remaining(self) -> int:
+        """The number of responses left when the time budget ran out."""
+
+        return self.total - self.done
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every response was warmed up within the time budget, including failures."""
+
+        return self.remaining == 0
@@ -0,0 +1,201 @@
+"""Module for the client-side rate limiter used by the HTTP service."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Mapping
+
+from barch.models import Route
+
+__all__ = ("TokenBucket", "RateLimiter")
+
+
+class TokenBucket:
+    """A token bucket which refills at a steady rate up to its capacity.
+
+    Waiting coroutines are served in arrival order, so a burst of requests queues up
+    instead of failing.
+
+    Args:
+        rate: The number of tokens added per second.
+        capacity: The maximum number of tokens, i.e. the largest allowed burst. Defaults to
+            `rate`, so at most one second worth of requests is sent at once, and at least 1.
+
+    Raises:
+        ValueError: When the rate is not positive or the capacity is less than 1.
+    """
+
+    __slots__ = ("_rate", "_capacity", "_tokens", "_updated_at", "_lock")
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0 or (capacity is not None and capacity < 1):
+            raise ValueError("rate must be positive and capacity at least 1.")
+
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def rate(self) -> float:
+        """The number of tokens added per second."""
+
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        """The maximum number of tokens."""
+
+        return self._capacity
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+
+        self._refill()
+
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    def can_acquire(self) -> bool:
+        """Check if a token can be taken without waiting.
+
+        Returns:
+            `False` if the bucket is empty or others are waiting for a token, else `True`.
+        """
+
+        if self._lock is not None and self._lock.locked():
+            return False
+
+        self._refill()
+
+        return self._tokens >= 1
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting.
+
+        Returns:
+            `True` if a token was taken, `False` if the bucket is empty or others are waiting.
+        """
+
+        if not self.can_acquire():
+            return False
+
+        self._tokens -= 1
+
+        return True
+
+    async def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # the lock queues the waiters, so only the first one sleeps for the next token
+        async with self._lock:
+            self._refill()
+
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+
+            self._tokens -= 1
+
+
+class RateLimiter:
+    """A rate limiter shared by every coroutine using the client, with a global token bucket
+    and optional per route buckets. A request needs a token from both.
+
+    Args:
+        rate: The optional global number of requests per second.
+        capacity: The optional global burst size, defaults to `rate`.
+        routes: The optional token buckets of single routes from `barch.endpoints`.
+        block: If `True`, requests wait for their tokens. If `False`, requests which can not
+            be made right away fail with a `429` [`HttpErrorResponse`][barch.HttpErrorResponse].
+
+    ??? example
+
+        ```py
+        from barch import Client, RateLimiter, TokenBucket, endpoints
+
+        limiter = RateLimiter(
+            rate=10, routes={endpoints.GET_CHARACTER: TokenBucket(5, capacity=2)}
+        )
+        client = Client(rate_limiter=limiter)
+
+        results = await client.character.get_characters(ids=range(10000, 10100))
+
+        await client.close()
+        ```
+    """
+
+    __slots__ = ("_bucket", "_routes", "_block")
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        capacity: float | None = None,
+        routes: Mapping[Route, TokenBucket] | None = None,
+        block: bool = True,
+    ) -> None:
+        self._bucket = TokenBucket(rate, capacity) if rate is not None else None
+        self._routes = dict(routes or {})
+        self._block = block
+
+    @property
+    def block(self) -> bool:
+        """Whether requests wait for their tokens instead of failing."""
+
+        return self._block
+
+    def _get_buckets(self, route: Route) -> list[TokenBucket]:
+        """Get the buckets a request to the given route takes a token from, the route
+        bucket first so no global token is held while waiting for it."""
+
+        route_bucket = self._routes.get(route)
+        buckets = [route_bucket] if route_bucket is not None else []
+
+        if self._bucket is not None:
+            buckets.append(self._bucket)
+
+        return buckets
+
+    def try_acquire(self, route: Route) -> bool:
+        """Take the tokens for a request to the route without waiting.
+
+        Args:
+            route: The endpoint route, one of the routes in `barch.endpoints`.
+
+        Returns:
+            `True` if the request can be made now, `False` otherwise.
+        """
+
+        buckets = self._get_buckets(route)
+
+        if not all(bucket.can_acquire() for bucket in buckets):
+            return False
+
+        for bucket in buckets:
+            bucket.try_acquire()
+
+        return True
+
+    async def acquire(self, route: Route) -> None:
+        """Take the tokens for a request to the route, waiting until they are available.
+
+        Args:
+            route: The endpoint route, one of the routes in `barch.endpoints`.
+        """
+
+        for bucket in self._get_buckets(route):
+            await bucket.acquire()
@@ -1,14 +1,18 @@
 """Module to serialize and deserialize JSON data and models."""
 
 from __future__ import annotations
-from typing import TypeVar, Any
+from typing import TypeVar, Any, Callable, Mapping
 from datetime import datetime
+import json
+
+import attrs
 
 from barch.models import (
     Character,
     Terrain,
     TerrainDetails,
     CharacterDetails,
+    LazyCharacterDetails,
     CharacterInfo,
     Image,
     Stats,
@@ -26,254 +30,296 @@ T = TypeVar("T")
 __all__ = ("Serializer",)
 
 
-class Serializer:
-    """Deserializes JSON data to models."""
+def _default_json_loads() -> Callable[[bytes], Any]:
+    """Get the fastest available JSON decoder, `orjson` or `msgspec` if installed and
+    the standard library `json` otherwise.
 
-    __slots__ = ()
+    Returns:
+        The function decoding a JSON document from bytes.
+    """
 
-    def _datetime_from_unix_ms(self, datetime_str: str | int | None) -> datetime | None:
-        """Converts unix timestamp in milliseconds to UTC datetime."""
+    try:
+        import orjson
 
-        return datetime.utcfromtimestamp(datetime_str / 1000) if datetime_str else None
+        return orjson.loads
 
-    def _to_camel_case(self, attr: str) -> str:
-        """Converts input arguments to camel case."""
-        first, *rest = attr.split("_")
-        return "".join((first.lower(), *map(str.title, rest)))
+    except ImportError:
+        pass
 
-    def _set_attrs(
-        self, model: Any, data: dict[str, Any], *attrs: str, camel_case: bool = False
-    ) -> None:
-        """Generate model from JSON payload."""
+    try:
+        import msgspec
 
-        if data:
-            for attr in attrs:
-                cased_attr = self._to_camel_case(attr) if camel_case else attr
+        return msgspec.json.decode
 
-                if data.get(cased_attr) is not None:
-                    setattr(model, attr, data[cased_attr])
-                else:
-                    setattr(model, attr, None)
+    except ImportError:
+        pass
 
-    def _set_attrs_cased(self, model: Any, data: dict[str, Any], *attrs: str) -> None:
-        """Generate model from JSON payload when input arguments need to be changed to camel case."""
+    return json.loads
 
-        return self._set_attrs(model, data, *attrs, camel_case=True)
 
-    def _deserialize_terrain(self, data: dict[str, Any]) -> Terrain:
-        """Deserializes JSON payload into `Terrain` model."""
+def _datetime_from_unix_ms(datetime_str: str | int | None) -> datetime | None:
+    """Converts unix timestamp in milliseconds to UTC datetime."""
 
-        terrain = Terrain()
+    return datetime.utcfromtimestamp(datetime_str / 1000) if datetime_str else None
 
-        terrain.urban = self._deserialize_terrain_details(data.get("urban", {}))
-        terrain.outdoor = self._deserialize_terrain_details(data.get("outdoor", {}))
-        terrain.indoor = self._deserialize_terrain_details(data.get("indoor", {}))
 
-        return terrain
+def _to_camel_case(attr: str) -> str:
+    """Converts input arguments to camel case."""
+    first, *rest = attr.split("_")
+    return "".join((first.lower(), *map(str.title, rest)))
 
-    def _deserialize_terrain_details(self, data: dict[str, Any]) -> TerrainDetails:
-        """Deserializes JSON payload into `TerrainDetails` model."""
 
-        terrain_details = TerrainDetails(
-            data.get("DamageDealt", ""), data.get("ShieldBlockRate", "")
-        )
+def _field_map(model: type, keys: Mapping[str, str]) -> dict[str, str]:
+    """Map every attribute of the model class to its JSON key, camel casing the
+    attributes which have no key given."""
 
-        return terrain_details
+    return {
+        field.name: keys.get(field.name, _to_camel_case(field.name))
+        for field in attrs.fields(model)
+    }
 
-    def deserialize_character(self, data: dict[str, Any]) -> Character:
-        """Deserializes JSON payload into `Character` model."""
 
-        character = Character()
-
-        character.position = Position.from_str(data.get("position", None))
-        character.role = Role.from_str(data.get("role", None))
-        character.rarity = Rarity.try_from_str(data.get("rarity", None))
-
-        character.terrain = self._deserialize_terrain(data.get("terrain", {}))
-
-        self._set_attrs_cased(
-            character,
-            data,
-            "id",
-            "name",
-            "profile",
-            "base_star",
-            "armor_type",
-            "bullet_type",
-            "weapon_type",
-            "squad_type",
-            "school",
-        )
+def _compile_deserializer(
+    model: type[T],
+    keys: Mapping[str, str] = {},
+    defaults: Mapping[str, Any] = {},
+    converters: Mapping[str, Callable[[Any], Any]] = {},
+) -> Callable[[dict[str, Any]], T]:
+    """Generate a function specialized in deserializing a JSON payload into the model class.
 
-        return character
+    The field map is resolved once here, so the generated function only does a single
+    `dict.get` and attribute assignment per attribute.
 
-    def deserialize_character_info(self, data: dict[str, Any]) -> CharacterInfo:
-        """Deserializes JSON payload into `CharacterInfo` model."""
+    Args:
+        model: The model class to deserialize into.
+        keys: The JSON keys of the attributes which are not the camel cased attribute name.
+        defaults: The values used for the attributes missing in the payload, else `None`.
+        converters: The functions applied to the payload values of the attributes.
 
-        charcter_info = CharacterInfo()
-
-        self._set_attrs_cased(
-            charcter_info,
-            data,
-            "age",
-            "birth_date",
-            "height",
-            "artist",
-            "club",
-            "school",
-            "school_year",
-            "voice_actor",
-        )
+    Returns:
+        The generated deserializer.
+    """
 
-        return charcter_info
+    namespace: dict[str, Any] = {"_model": model, "_new": object.__new__}
+    lines = ["def deserialize(data):", "    model = _new(_model)", "    get = data.get"]
 
-    def deserialize_stats(self, data: dict[str, Any]) -> Stats:
-        """Deserializes JSON payload into `Stats` model."""
+    for attr, key in _field_map(model, keys).items():
+        value = f"get({key!r})"
 
-        character_stats = Stats()
-
-        self._set_attrs_cased(
-            character_stats,
-            data,
-            "id",
-            "attack_level1",
-            "attack_level100",
-            "defense_level1",
-            "defense_level100",
-            "heal_power_level1",
-            "heal_power_level100",
-            "def_penetrate_level1",
-            "def_penetrate_level100",
-            "ammo_count",
-            "ammo_cost",
-            "range",
-            "move_speed",
-            "street_mood",
-            "outdoor_mood",
-            "indoor_mood",
-        )
+        if attr in defaults:
+            namespace[f"_default_{attr}"] = defaults[attr]
+            value = f"get({key!r}, _default_{attr})"
 
-        setattr(character_stats, "max_hp_level1", data["maxHPLevel1"])
-        setattr(character_stats, "max_hp_level100", data["maxHPLevel100"])
+        if attr in converters:
+            namespace[f"_convert_{attr}"] = converters[attr]
+            value = f"_convert_{attr}({value})"
 
-        return character_stats
+        lines.append(f"    model.{attr} = {value}")
 
-    def deserialize_skills_details(self, data: dict[str, Any]) -> CommonModel:
-        """Deserializes JSON payload into `CommonModel` model."""
+    lines.append("    return model")
 
-        return [
-            CommonModel(skill.get("id"), skill.get("name"), skill.get("description", ""))
-            for skill in data
-        ]
+    exec("\n".join(lines), namespace)
 
-    def deserialize_skills(self, data: dict[str, Any]) -> Skills:
-        """Deserializes JSON payload into `Skills` model."""
+    deserialize = namespace["deserialize"]
+    deserialize.__qualname__ = deserialize.__name__ = f"deserialize_{model.__name__}"
 
-        character_skills = Skills()
+    return deserialize
 
-        character_skills.ex = (
-            self.deserialize_skills_details(data.get("ex", [])[0])
-            if data.get("ex", None)
-            else None
-        )
 
-        character_skills.normal = (
-            self.deserialize_skills_details(data.get("normal", [])[0])
-            if data.get("normal", None)
-            else None
-        )
+def _list_of(deserialize: Callable[[Any], T]) -> Callable[[list[Any]], list[T]]:
+    """Wrap a deserializer to deserialize every element of a list."""
 
-        character_skills.passive = (
-            self.deserialize_skills_details(data.get("passive", [])[0])
-            if data.get("passive", None)
-            else None
-        )
+    return lambda data: [deserialize(element) for element in data]
+
+
+_deserialize_terrain_details = _compile_deserializer(
+    TerrainDetails,
+    keys={"damage_dealt": "DamageDealt", "shield_block_rate": "ShieldBlockRate"},
+    defaults={"damage_dealt": "", "shield_block_rate": ""},
+)
+
+_deserialize_terrain = _compile_deserializer(
+    Terrain,
+    defaults=dict.fromkeys(("urban", "outdoor", "indoor"), {}),
+    converters=dict.fromkeys(
+        ("urban", "outdoor", "indoor"), _deserialize_terrain_details
+    ),
+)
+
+_ENUM_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "position": Position.from_str,
+    "role": Role.from_str,
+    "rarity": Rarity.try_from_str,
+}
+
+_deserialize_base_character = _compile_deserializer(
+    BaseCharacter, converters=_ENUM_CONVERTERS
+)
+
+_deserialize_character = _compile_deserializer(
+    Character,
+    defaults={"terrain": {}},
+    converters={**_ENUM_CONVERTERS, "terrain": _deserialize_terrain},
+)
+
+_deserialize_character_info = _compile_deserializer(CharacterInfo)
+
+_deserialize_stats = _compile_deserializer(
+    Stats, keys={"max_hp_level1": "maxHPLevel1", "max_hp_level100": "maxHPLevel100"}
+)
+
+_deserialize_common_model = _compile_deserializer(
+    CommonModel, defaults={"description": ""}
+)
+
+
+def _deserialize_skill_list(data: list[list[Any]] | None) -> list[CommonModel] | None:
+    """Deserializes the first list of a skill type's JSON payload into `CommonModel` models."""
+
+    return [_deserialize_common_model(skill) for skill in data[0]] if data else None
+
+
+_deserialize_skills = _compile_deserializer(
+    Skills,
+    converters=dict.fromkeys(
+        ("ex", "normal", "passive", "sub"), _deserialize_skill_list
+    ),
+)
+
+_deserialize_image = _compile_deserializer(
+    Image, defaults=dict.fromkeys(("icon", "lobby", "portrait"), "")
+)
+
+_deserialize_character_details = _compile_deserializer(
+    CharacterDetails,
+    defaults=dict.fromkeys(
+        ("character", "info", "stat", "terrain", "image", "skills"), {}
+    ),
+    converters={
+        "character": _deserialize_base_character,
+        "info": _deserialize_character_info,
+        "stat": _deserialize_stats,
+        "terrain": _deserialize_terrain,
+        "image": _deserialize_image,
+        "skills": _deserialize_skills,
+    },
+)
 
-        character_skills.sub = (
-            self.deserialize_skills_details(data.get("sub", [])[0])
-            if data.get("sub", None)
+_deserialize_characters = _compile_deserializer(Characters)
+
+_deserialize_raid = _compile_deserializer(
+    Raid,
+    converters=dict.fromkeys(
+        ("start_at", "settle_at", "end_at"), _datetime_from_unix_ms
+    ),
+)
+
+_deserialize_raids = _compile_deserializer(
+    Raids,
+    defaults=dict.fromkeys(("current", "upcoming", "ended"), []),
+    converters=dict.fromkeys(
+        ("current", "upcoming", "ended"), _list_of(_deserialize_raid)
+    ),
+)
+
+
+class Serializer:
+    """Deserializes JSON data to models.
+
+    Every model has a deserializer generated once at import, with its attributes already
+    mapped to their JSON keys.
+
+    Args:
+        lazy: If `True`, the `CharacterDetails` sub-models are only deserialized on first
+            access, see [`LazyCharacterDetails`][barch.LazyCharacterDetails].
+    """
+
+    __slots__ = ("_lazy_loaders",)
+
+    def __init__(self, lazy: bool = False) -> None:
+        self._lazy_loaders = (
+            {
+                "character": self.deserialize_base_character,
+                "info": self.deserialize_character_info,
+                "stat": self.deserialize_stats,
+                "terrain": self._deserialize_terrain,
+                "image": self.deserialize_image,
+                "skills": self.deserialize_skills,
+            }
+            if lazy
             else None
         )
 
-        return character_skills
+    def _deserialize_terrain(self, data: dict[str, Any]) -> Terrain:
+        """Deserializes JSON payload into `Terrain` model."""
+
+        return _deserialize_terrain(data)
+
+    def _deserialize_terrain_details(self, data: dict[str, Any]) -> TerrainDetails:
+        """Deserializes JSON payload into `TerrainDetails` model."""
+
+        return _deserialize_terrain_details(data)
+
+    def deserialize_character(self, data: dict[str, Any]) -> Character:
+        """Deserializes JSON payload into `Character` model."""
+
+        return _deserialize_character(data)
+
+    def deserialize_character_info(self, data: dict[str, Any]) -> CharacterInfo:
+        """Deserializes JSON payload into `CharacterInfo` model."""
+
+        return _deserialize_character_info(data)
+
+    def deserialize_stats(self, data: dict[str, Any]) -> Stats:
+        """Deserializes JSON payload into `Stats` model."""
+
+        return _deserialize_stats(data)
+
+    def deserialize_skills_details(self, data: dict[str, Any]) -> CommonModel:
+        """Deserializes JSON payload into `CommonModel` model."""
+
+        return [_deserialize_common_model(skill) for skill in data]
+
+    def deserialize_skills(self, data: dict[str, Any]) -> Skills:
+        """Deserializes JSON payload into `Skills` model."""
+
+        return _deserialize_skills(data)
 
     def deserialize_image(self, data: dict[str, Any]) -> Image:
         """Deserializes JSON payload into `Image` model."""
 
-        return Image(
-            data.get("icon", ""),
-            data.get("portrait", ""),
-            data.get("lobby", ""),
-        )
+        return _deserialize_image(data)
 
     def deserialize_base_character(self, data: dict[str, Any]) -> BaseCharacter:
         """Deserializes JSON payload into `BaseCharacter` model."""
 
-        character = BaseCharacter()
-
-        character.position = Position.from_str(data.get("position", None))
-        character.role = Role.from_str(data.get("role", None))
-        character.rarity = Rarity.try_from_str(data.get("rarity", None))
-
-        self._set_attrs_cased(
-            character,
-            data,
-            "name",
-            "profile",
-            "base_star",
-            "armor_type",
-            "bullet_type",
-            "weapon_type",
-            "squad_type",
-        )
-
-        return character
+        return _deserialize_base_character(data)
 
     def deserialize_character_details(self, data: dict[str, Any]) -> CharacterDetails:
         """Deserializes JSON payload into `CharacterDetails` model."""
 
-        charcter_details = CharacterDetails()
-
-        charcter_details.character = self.deserialize_base_character(data.get("character", {}))
-
-        charcter_details.info = self.deserialize_character_info(data.get("info", {}))
-        charcter_details.stat = self.deserialize_stats(data.get("stat", {}))
-        charcter_details.terrain = self._deserialize_terrain(data.get("terrain", {}))
-
-        charcter_details.image = self.deserialize_image(data.get("image", {}))
+        if self._lazy_loaders is not None:
+            charcter_details = LazyCharacterDetails(data, self._lazy_loaders)
 
-        charcter_details.skills = self.deserialize_skills(data.get("skills", {}))
+            charcter_details.id = data.get("id")
+            charcter_details.is_released = data.get("isReleased")
+            charcter_details.is_playable = data.get("isPlayable")
 
-        self._set_attrs_cased(charcter_details, data, "id", "is_released", "is_playable")
+            return charcter_details
 
-        return charcter_details
+        return _deserialize_character_details(data)
 
     def deserialize_characters_from_query(self, data: dict[str, Any]) -> Characters:
         """Deserializes JSON payload into `Characters` model."""
 
-        return Characters(data.get("id"), data.get("name"))
+        return _deserialize_characters(data)
 
     def deserialize_raid(self, data: dict[str, Any]) -> Raid:
         """Deserializes JSON payload into `Raid` model."""
 
-        raid = Raid()
-
-        raid.start_at = self._datetime_from_unix_ms(data.get("startAt", None))
-        raid.settle_at = self._datetime_from_unix_ms(data.get("settleAt", None))
-        raid.end_at = self._datetime_from_unix_ms(data.get("endAt", None))
-
-        self._set_attrs_cased(raid, data, "season_id", "boss_name")
-
-        return raid
+        return _deserialize_raid(data)
 
     def deserialize_raids(self, data: dict[str, Any]) -> Raids:
         """Deserializes JSON payload into `Raids` model."""
 
-        raids = Raids()
-        raids.current = [self.deserialize_raid(raid) for raid in data.get("current", [])]
-
-        raids.upcoming = [self.deserialize_raid(raid) for raid in data.get("upcoming", [])]
-
-        raids.ended = [self.deserialize_raid(raid) for raid in data.get("ended", [])]
-
-        return raids
+        return _deserialize_raids(data)
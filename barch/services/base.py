@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import abc
+import time
+from typing import Any, Callable, Literal, TypeVar
 
 from barch.services import HttpService
+from barch.models import HttpSuccessResponse
 from barch import serializer
 
+T = TypeVar("T")
+
+RawT = Literal["bytes", "json"]
+"""The raw modes of the service methods, the undecoded response body or the decoded JSON data."""
+
 
 __all__ = ("BaseService",)
 
@@ -26,3 +34,78 @@ class BaseService(abc.ABC):
     ) -> None:
         self._http = http_service
         self._serializer = serializer
+
+    def _deserialize(
+        self, response: HttpSuccessResponse, name: str, deserialize: Callable[[Any], T]
+    ) -> T:
+        """Deserialize the data of a response, reusing the models of a previous call with the
+        same response, like when it is served from the cache or revalidated with a `304`.
+        With instrumentation, the deserialization time is added to the call timing.
+
+        A list of models is returned as a new list, so a caller can sort or extend it without
+        changing what the next callers receive, but the models themselves are shared.
+
+        Args:
+            response: The response to deserialize.
+            name: The name identifying the kind of models deserialized from the response.
+            deserialize: The function deserializing the response data.
+
+        Returns:
+            The deserialized models.
+        """
+
+        instrumentation = self._http.instrumentation
+        timing = instrumentation.take_pending() if instrumentation else None
+        start = time.perf_counter()
+        key = (self._serializer, name)
+        models = response.deserialized.get(key)
+
+        if models is None:
+            models = response.deserialized[key] = deserialize(
+                self._http.decode(response)
+            )
+
+        if timing is not None:
+            timing.deserialize = time.perf_counter() - start
+            instrumentation.finish(timing)
+
+        return list(models) if isinstance(models, list) else models
+
+    def _should_decode(self, raw: RawT | None) -> bool:
+        """Validate the raw mode of a call before its request is made.
+
+        Args:
+            raw: The optional raw mode.
+
+        Returns:
+            `False` if the response body is returned undecoded, else `True`.
+
+        Raises:
+            ValueError: When the raw mode is not `None`, `"bytes"` or `"json"`.
+        """
+
+        if raw not in (None, "bytes", "json"):
+            raise ValueError("raw must be either 'bytes' or 'json'.")
+
+        return raw != "bytes"
+
+    def _raw(self, response: HttpSuccessResponse, raw: RawT) -> bytes | Any:
+        """Get a response as is, without deserializing it into models.
+
+        Args:
+            response: The response.
+            raw: `"bytes"` for the undecoded response body or `"json"` for the decoded JSON
+                data, which is shared with the cache and must not be modified.
+
+        Returns:
+            The response body or data.
+        """
+
+        instrumentation = self._http.instrumentation
+        timing = instrumentation.take_pending() if instrumentation else None
+        value = response.body if raw == "bytes" else self._http.decode(response)
+
+        if timing is not None:
+            instrumentation.finish(timing)
+
+        return value
@@ -1,18 +1,23 @@
 """Moduke for character related services."""
 
 from __future__ import annotations
-from typing import TypeVar
+from typing import Any, TypeVar, AsyncIterator, Iterable
+import asyncio
 
-from .base import BaseService
+from .base import BaseService, RawT
 from barch.models import (
     HttpErrorResponse,
     Character,
     CharacterDetails,
     Characters,
+    BilingualCharacter,
+    BilingualCharacterDetails,
 )
 from barch.enums import Role, Position
 from barch import endpoints
 from barch.result import Result, Success, Error
+from barch.index import CharacterIndex
+from barch.table import CharacterTable
 
 
 T = TypeVar("T")
@@ -23,44 +28,73 @@ __all__ = ("CharacterService",)
 
 
 class CharacterService(BaseService):
-    """The service that handles all the methods related to characters."""
+    """The service that handles all the methods related to characters.
+
+    With a cache, the returned models are shared by every call served by the same response,
+    so they must not be modified. The returned lists are copies and can be changed.
+    """
 
     __slots__ = ()
 
     async def _get_all_characters(
-        self, is_jp: bool = False
-    ) -> ResultT[list[Character]]:
+        self, is_jp: bool = False, raw: RawT | None = None
+    ) -> ResultT[list[Character] | bytes | list[dict[str, Any]]]:
         """Internal method for getting all character details which is used by the
         EN and JP version service methods.
 
         Keyword Args:
             is_jp: the optional boolean flag, which specifies if the character details need to be fetched
                 in EN or JP version.
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
 
         Returns:
             [`Result`][barch.Result] containing `list[Character]` on success or error data on error.
+
+        Raises:
+            ValueError: When the raw mode is invalid.
         """
 
+        decode = self._should_decode(raw)
+
         if is_jp:
             route = endpoints.GET_ALL_CHARACTERS_JP.generate_route()
         else:
             route = endpoints.GET_ALL_CHARACTERS.generate_route()
 
-        result = await self._http.fetch(route)
+        result = await self._http.fetch(route, decode)
 
         if isinstance(result, HttpErrorResponse):
             return Error(result)
 
+        if raw:
+            return Success(self._raw(result, raw))
+
         return Success(
-            [self._serializer.deserialize_character(element) for element in result.data]
+            self._deserialize(
+                result,
+                "characters",
+                lambda data: [
+                    self._serializer.deserialize_character(element) for element in data
+                ],
+            )
         )
 
-    async def get_all_characters(self) -> ResultT[list[Character]]:
+    async def get_all_characters(
+        self, raw: RawT | None = None
+    ) -> ResultT[list[Character] | bytes | list[dict[str, Any]]]:
         """Get all the characters with details EN version.
 
+        Keyword Args:
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
+
         Returns:
             [`Result`][barch.Result] containing `list[Character]` on success or error data on error.
 
+        Raises:
+            ValueError: When the raw mode is invalid.
+
         ??? example
 
             ```py
@@ -80,14 +114,23 @@ class CharacterService(BaseService):
             ```
         """
 
-        return await self._get_all_characters()
+        return await self._get_all_characters(raw=raw)
 
-    async def get_all_characters_jp(self) -> ResultT[list[Character]]:
+    async def get_all_characters_jp(
+        self, raw: RawT | None = None
+    ) -> ResultT[list[Character] | bytes | list[dict[str, Any]]]:
         """Get all the characters with details japanese version.
 
+        Keyword Args:
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
+
         Returns:
             [`Result`][barch.Result] containing `list[Character]` on success or error data on error.
 
+        Raises:
+            ValueError: When the raw mode is invalid.
+
         ??? example
 
             ```py
@@ -106,11 +149,244 @@ class CharacterService(BaseService):
             await client.close()
         """
 
-        return await self._get_all_characters(is_jp=True)
+        return await self._get_all_characters(is_jp=True, raw=raw)
+
+    async def get_character_index(self) -> ResultT[CharacterIndex]:
+        """Get a [`CharacterIndex`][barch.CharacterIndex] built from all the characters, EN version,
+        which answers character queries locally.
+
+        Returns:
+            [`Result`][barch.Result] containing `CharacterIndex` on success or error data on error.
+
+        ??? example
+
+            ```py
+            from barch import Client, Role
+
+            client = Client()
+
+            result = await client.character.get_character_index()
+
+            if result.is_success:
+                characters = result.value.query(role=Role.Healer)
+
+            await client.close()
+            ```
+        """
+
+        result = await self._get_all_characters()
+
+        if result.is_error:
+            return result
+
+        return Success(CharacterIndex(result.value))
+
+    async def get_character_index_jp(self) -> ResultT[CharacterIndex]:
+        """Get a [`CharacterIndex`][barch.CharacterIndex] built from all the characters, JP version,
+        which answers character queries locally.
+
+        Returns:
+            [`Result`][barch.Result] containing `CharacterIndex` on success or error data on error.
+        """
+
+        result = await self._get_all_characters(is_jp=True)
+
+        if result.is_error:
+            return result
+
+        return Success(CharacterIndex(result.value))
+
+    async def _get_character_table(
+        self, is_jp: bool = False
+    ) -> ResultT[CharacterTable]:
+        """Internal method for getting the character table which is used by the
+        EN and JP version service methods.
+
+        Keyword Args:
+            is_jp: the optional boolean flag, which specifies if the characters need to be fetched
+                in EN or JP version.
+
+        Returns:
+            [`Result`][barch.Result] containing `CharacterTable` on success or error data on error.
+        """
+
+        if is_jp:
+            route = endpoints.GET_ALL_CHARACTERS_JP.generate_route()
+        else:
+            route = endpoints.GET_ALL_CHARACTERS.generate_route()
+
+        result = await self._http.fetch(route)
+
+        if isinstance(result, HttpErrorResponse):
+            return Error(result)
+
+        return Success(
+            self._deserialize(result, "character_table", CharacterTable.from_payload)
+        )
+
+    async def get_character_table(self) -> ResultT[CharacterTable]:
+        """Get a columnar [`CharacterTable`][barch.CharacterTable] of all the characters, EN version,
+        built from the API payload without creating a `Character` per character.
+
+        Returns:
+            [`Result`][barch.Result] containing `CharacterTable` on success or error data on error.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            result = await client.character.get_character_table()
+
+            if result.is_success:
+                counts = result.value.value_counts("school", "role")
+
+            await client.close()
+            ```
+        """
+
+        return await self._get_character_table()
+
+    async def get_character_table_jp(self) -> ResultT[CharacterTable]:
+        """Get a columnar [`CharacterTable`][barch.CharacterTable] of all the characters, JP version,
+        built from the API payload without creating a `Character` per character.
+
+        Returns:
+            [`Result`][barch.Result] containing `CharacterTable` on success or error data on error.
+        """
+
+        return await self._get_character_table(is_jp=True)
+
+    async def get_all_characters_bilingual(self) -> ResultT[list[BilingualCharacter]]:
+        """Get all the characters of both the EN and JP versions, joined by id. Both rosters
+        are fetched concurrently, so this takes as long as the slower of the two requests.
+
+        Returns:
+            [`Result`][barch.Result] containing `list[BilingualCharacter]` on success, the EN
+                characters first in roster order and then the JP only characters, or the error
+                data of the first failed request on error.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            result = await client.character.get_all_characters_bilingual()
+
+            if result.is_success:
+                for character in result.value:
+                    if character.is_released_jp and not character.is_released_en:
+                        print(character.jp.name)
+
+            await client.close()
+            ```
+        """
+
+        en, jp = await asyncio.gather(
+            self._get_all_characters(), self._get_all_characters(is_jp=True)
+        )
+
+        if en.is_error:
+            return en
+
+        if jp.is_error:
+            return jp
+
+        characters = {
+            character.id: BilingualCharacter(character.id, en=character)
+            for character in en.value
+        }
+
+        for character in jp.value:
+            bilingual = characters.get(character.id)
+
+            if bilingual is None:
+                characters[character.id] = BilingualCharacter(
+                    character.id, jp=character
+                )
+
+            else:
+                bilingual.jp = character
+
+        return Success(list(characters.values()))
+
+    async def _iter_all_characters(
+        self, is_jp: bool = False
+    ) -> AsyncIterator[ResultT[Character]]:
+        """Internal method for streaming all the characters which is used by the EN and JP
+        version service methods.
+
+        Keyword Args:
+            is_jp: the optional boolean flag, which specifies if the characters need to be fetched
+                in EN or JP version.
+
+        Yields:
+            [`Result`][barch.Result] containing a `Character` for every character on success, or
+                a single error result on error.
+        """
+
+        if is_jp:
+            route = endpoints.GET_ALL_CHARACTERS_JP.generate_route()
+        else:
+            route = endpoints.GET_ALL_CHARACTERS.generate_route()
+
+        async for element in self._http.stream(route):
+            if isinstance(element, HttpErrorResponse):
+                yield Error(element)
+                return
+
+            yield Success(self._serializer.deserialize_character(element))
+
+    def iter_all_characters(self) -> AsyncIterator[ResultT[Character]]:
+        """Stream all the characters with details EN version, yielding each character as soon
+        as it is decoded from the response.
+
+        Yields:
+            [`Result`][barch.Result] containing a `Character` for every character on success, or
+                a single error result on error.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            async for result in client.character.iter_all_characters():
+                if result.is_success:
+                    character = result.value
+
+                if result.is_error:
+                    error = result.error
+
+            await client.close()
+            ```
+        """
+
+        return self._iter_all_characters()
+
+    def iter_all_characters_jp(self) -> AsyncIterator[ResultT[Character]]:
+        """Stream all the characters with details japanese version, yielding each character as
+        soon as it is decoded from the response.
+
+        Yields:
+            [`Result`][barch.Result] containing a `Character` for every character on success, or
+                a single error result on error.
+        """
+
+        return self._iter_all_characters(is_jp=True)
 
     async def _get_character(
-        self, name: str | None = None, id: int | None = None, is_jp: bool = False
-    ) -> ResultT[CharacterDetails]:
+        self,
+        name: str | None = None,
+        id: int | None = None,
+        is_jp: bool = False,
+        raw: RawT | None = None,
+    ) -> ResultT[CharacterDetails | bytes | dict[str, Any]]:
         """Internal method used to get a single character details, which is used by both EN and JP versions.
 
         Keyword Args:
@@ -120,48 +396,54 @@ class CharacterService(BaseService):
 
             is_jp: The optional is_jp flag which specifies if the character details need to be fetched in EN or JP version.
 
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
+
         Returns:
             [`Result`][barch.Result] containing `CharacterDetails` on success or error data on error.
 
+        Raises:
+            ValueError: When the raw mode is invalid.
         """
 
-        params: dict = {}
-
-        if id:
-            params.update({"id": "true"})
-
-        if is_jp:
-            route = endpoints.GET_CHARACTER_JP.generate_route(
-                name if name else id
-            ).with_params(params if params else None)
-
-        else:
-            route = endpoints.GET_CHARACTER.generate_route(
-                name if name else id
-            ).with_params(params if params else None)
-
-        result = await self._http.fetch(route)
+        decode = self._should_decode(raw)
+        route = endpoints.generate_character_route(name=name, id=id, is_jp=is_jp)
+        result = await self._http.fetch(route, decode)
 
         if isinstance(result, HttpErrorResponse):
             return Error(result)
 
-        return Success(self._serializer.deserialize_character_details(result.data))
+        if raw:
+            return Success(self._raw(result, raw))
+
+        return Success(
+            self._deserialize(
+                result,
+                "character_details",
+                self._serializer.deserialize_character_details,
+            )
+        )
 
     async def get_character(
-        self, name: str | None = None, id: int | None = None
-    ) -> ResultT[CharacterDetails]:
+        self,
+        name: str | None = None,
+        id: int | None = None,
+        raw: RawT | None = None,
+    ) -> ResultT[CharacterDetails | bytes | dict[str, Any]]:
         """Get a single character either by name or id, EN version.
         Atleast one parameter, either name or id need to be specified.
 
         Keyword Args:
             name: The optional name of the character.
             id: The optional id of the character.
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
 
         Returns:
             [`Result`][barch.Result] containing `CharacterDetails]` on success or error data on error.
 
         Raises:
-            ValueError: When no arguments are given
+            ValueError: When no arguments are given or the raw mode is invalid.
 
         ??? example
 
@@ -183,24 +465,32 @@ class CharacterService(BaseService):
         """
 
         if name or id:
-            return await self._get_character(name=name, id=id)
+            return await self._get_character(name=name, id=id, raw=raw)
 
         else:
             raise ValueError("Atleast one parameter must be specified.")
 
     async def get_character_jp(
-        self, name: str | None = None, id: int | None = None
-    ) -> ResultT[CharacterDetails]:
+        self,
+        name: str | None = None,
+        id: int | None = None,
+        raw: RawT | None = None,
+    ) -> ResultT[CharacterDetails | bytes | dict[str, Any]]:
         """Get a single character either by name or id, JP version.
         Atleast one parameter, either name or id need to be specified.
 
         Keyword Args:
             name: The optional name of the character. Note that the character input name needs to be JP.
             id: The optional id of the character.
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
 
         Returns:
             [`Result`][barch.Result] containing `CharacterDetails` on success or error data on error.
 
+        Raises:
+            ValueError: When the raw mode is invalid.
+
         ??? example
 
             ```py
@@ -219,7 +509,281 @@ class CharacterService(BaseService):
             await client.close()
             ```"""
 
-        return await self._get_character(name=name, id=id, is_jp=True)
+        return await self._get_character(name=name, id=id, is_jp=True, raw=raw)
+
+    async def get_character_bilingual(
+        self, id: int
+    ) -> ResultT[BilingualCharacterDetails]:
+        """Get a single character by id of both the EN and JP versions. Both versions are
+        fetched concurrently, so this takes as long as the slower of the two requests.
+
+        Args:
+            id: The id of the character, required as the versions can only be joined by id.
+
+        Returns:
+            [`Result`][barch.Result] containing `BilingualCharacterDetails` on success, with
+                `None` for a version the character is not in, or the error data on error,
+                including when the character is in neither version.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            result = await client.character.get_character_bilingual(10000)
+
+            if result.is_success:
+                character = result.value
+
+                if character.is_released_en:
+                    name = character.en.character.name
+
+            await client.close()
+            ```
+        """
+
+        en, jp = await asyncio.gather(
+            self._get_character(id=id), self._get_character(id=id, is_jp=True)
+        )
+
+        for result in (en, jp):
+            if result.is_error and result.error.status != 404:
+                return result
+
+        if en.is_error and jp.is_error:
+            return en
+
+        return Success(
+            BilingualCharacterDetails(
+                id,
+                en=None if en.is_error else en.value,
+                jp=None if jp.is_error else jp.value,
+            )
+        )
+
+    def _bulk_lookups(
+        self, ids: Iterable[int] | None, names: Iterable[str] | None, concurrency: int
+    ) -> list[dict[str, int | str]]:
+        """Internal method that validates the bulk fetch arguments and builds the lookups.
+
+        Returns:
+            The keyword arguments for `_get_character`, ids first and then names, in input order.
+
+        Raises:
+            ValueError: When no ids or names are given or the concurrency is less than 1.
+        """
+
+        lookups: list[dict[str, int | str]] = [{"id": id} for id in ids or ()]
+        lookups.extend({"name": name} for name in names or ())
+
+        if not lookups:
+            raise ValueError("Atleast one parameter must be specified.")
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        return lookups
+
+    async def _get_characters(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+        is_jp: bool = False,
+    ) -> list[ResultT[CharacterDetails]]:
+        """Internal method used to get multiple character details, which is used by both EN and JP versions.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters.
+            concurrency: The maximum number of requests made at the same time.
+            is_jp: The optional is_jp flag which specifies if the character details need to be fetched in EN or JP version.
+
+        Returns:
+            A list with a [`Result`][barch.Result] for every id and then every name, in input order.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(lookup: dict[str, int | str]) -> ResultT[CharacterDetails]:
+            async with semaphore:
+                return await self._get_character(**lookup, is_jp=is_jp)
+
+        return list(
+            await asyncio.gather(
+                *(get(lookup) for lookup in self._bulk_lookups(ids, names, concurrency))
+            )
+        )
+
+    async def _iter_characters(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+        is_jp: bool = False,
+    ) -> AsyncIterator[tuple[int | str, ResultT[CharacterDetails]]]:
+        """Internal method used to yield multiple character details as they arrive, which is used by
+        both EN and JP versions.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters.
+            concurrency: The maximum number of requests made at the same time.
+            is_jp: The optional is_jp flag which specifies if the character details need to be fetched in EN or JP version.
+
+        Yields:
+            The id or name of each character with its [`Result`][barch.Result], in completion order.
+        """
+
+        lookups = self._bulk_lookups(ids, names, concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(
+            lookup: dict[str, int | str]
+        ) -> tuple[int | str, ResultT[CharacterDetails]]:
+            async with semaphore:
+                result = await self._get_character(**lookup, is_jp=is_jp)
+
+            return next(iter(lookup.values())), result
+
+        tasks = [asyncio.ensure_future(get(lookup)) for lookup in lookups]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_characters(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+    ) -> list[ResultT[CharacterDetails]]:
+        """Get multiple characters by ids and names, EN version.
+        Atleast one id or name needs to be specified. A failed lookup does not fail the others.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters.
+            concurrency: The maximum number of requests made at the same time, defaults to 10.
+
+        Returns:
+            A list with a [`Result`][barch.Result] containing `CharacterDetails` on success or error
+                data on error for every id and then every name, in input order.
+
+        Raises:
+            ValueError: When no ids or names are given or the concurrency is less than 1.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            results = await client.character.get_characters(ids=[10000, 10001], concurrency=5)
+
+            for result in results:
+                if result.is_success:
+                    character = result.value
+
+                if result.is_error:
+                    error = result.error
+
+            await client.close()
+            ```
+        """
+
+        return await self._get_characters(ids, names, concurrency)
+
+    async def get_characters_jp(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+    ) -> list[ResultT[CharacterDetails]]:
+        """Get multiple characters by ids and names, JP version.
+        Atleast one id or name needs to be specified. A failed lookup does not fail the others.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters. Note that the names need to be JP.
+            concurrency: The maximum number of requests made at the same time, defaults to 10.
+
+        Returns:
+            A list with a [`Result`][barch.Result] containing `CharacterDetails` on success or error
+                data on error for every id and then every name, in input order.
+
+        Raises:
+            ValueError: When no ids or names are given or the concurrency is less than 1.
+        """
+
+        return await self._get_characters(ids, names, concurrency, is_jp=True)
+
+    def iter_characters(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+    ) -> AsyncIterator[tuple[int | str, ResultT[CharacterDetails]]]:
+        """Get multiple characters by ids and names as they arrive, EN version.
+        Atleast one id or name needs to be specified.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters.
+            concurrency: The maximum number of requests made at the same time, defaults to 10.
+
+        Yields:
+            The id or name of each character with its [`Result`][barch.Result], in completion order.
+
+        Raises:
+            ValueError: When no ids or names are given or the concurrency is less than 1.
+
+        ??? example
+
+            ```py
+            from barch import Client
+
+            client = Client()
+
+            async for id, result in client.character.iter_characters(ids=range(10000, 10100)):
+                if result.is_success:
+                    character = result.value
+
+            await client.close()
+            ```
+        """
+
+        return self._iter_characters(ids, names, concurrency)
+
+    def iter_characters_jp(
+        self,
+        ids: Iterable[int] | None = None,
+        names: Iterable[str] | None = None,
+        concurrency: int = 10,
+    ) -> AsyncIterator[tuple[int | str, ResultT[CharacterDetails]]]:
+        """Get multiple characters by ids and names as they arrive, JP version.
+        Atleast one id or name needs to be specified.
+
+        Keyword Args:
+            ids: The optional ids of the characters.
+            names: The optional names of the characters. Note that the names need to be JP.
+            concurrency: The maximum number of requests made at the same time, defaults to 10.
+
+        Yields:
+            The id or name of each character with its [`Result`][barch.Result], in completion order.
+
+        Raises:
+            ValueError: When no ids or names are given or the concurrency is less than 1.
+        """
+
+        return self._iter_characters(ids, names, concurrency, is_jp=True)
 
     async def get_character_by_query(
         self,
@@ -231,7 +795,8 @@ class CharacterService(BaseService):
         weapon: str | None = None,
         damage: str | None = None,
         armor: str | None = None,
-    ) -> ResultT[Characters]:
+        raw: RawT | None = None,
+    ) -> ResultT[list[Characters] | bytes | list[dict[str, Any]]]:
         """Get a single character details based on different parameters.
         Atleast one parameter must be specified. Multiple parameters can be specified
         to get characters based on different filters.
@@ -245,12 +810,14 @@ class CharacterService(BaseService):
             weapon: The optional `weapon` parameter, which gets characters by their weapon.
             damage: The optional `damage` parameter.
             armor: The optional `armor` parameter.
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
 
         Returns:
             [`Result`][barch.Result] containing `Characters` on success or error data on error.
 
         Raises:
-            ValueError: When no arguments are given.
+            ValueError: When no arguments are given or the raw mode is invalid.
 
         ??? example
 
@@ -282,17 +849,25 @@ class CharacterService(BaseService):
                 "armor": armor if armor else "",
             }
 
+            decode = self._should_decode(raw)
             route = endpoints.GET_CHARACTER_QUERY.generate_route().with_params(params)
-            result = await self._http.fetch(route)
+            result = await self._http.fetch(route, decode)
 
             if isinstance(result, HttpErrorResponse):
                 return Error(result)
 
+            if raw:
+                return Success(self._raw(result, raw))
+
             return Success(
-                [
-                    self._serializer.deserialize_characters_from_query(char)
-                    for char in result.data
-                ]
+                self._deserialize(
+                    result,
+                    "characters_from_query",
+                    lambda data: [
+                        self._serializer.deserialize_characters_from_query(char)
+                        for char in data
+                    ],
+                )
             )
 
         else:
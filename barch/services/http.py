@@ -1,24 +1,338 @@
 """Module for HTTP service."""
 
 from __future__ import annotations
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Mapping, TypeVar
+from datetime import datetime, timezone
+import asyncio
+import codecs
+import json
+import math
+import re
+import time
 
-from barch.models import GenerateRoute, HttpSuccessResponse, HttpErrorResponse
+from barch.models import (
+    Route,
+    GenerateRoute,
+    HttpSuccessResponse,
+    HttpErrorResponse,
+    ConnectorConfig,
+    RetryPolicy,
+)
+from barch.cache import BaseCache, CacheEntry
+from barch.ratelimit import RateLimiter
+from barch.timing import Instrumentation, RequestTiming
+from barch.serializer import _default_json_loads
 
-import aiohttp
+if TYPE_CHECKING:
+    import aiohttp
 
 T = TypeVar("T")
 
 __all__ = ("HttpService",)
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
-class HttpService:
-    """The HTTP service that is used to make requets to API."""
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+"""The characters which can continue a JSON number."""
+
+_LEASE_POLL_INTERVAL = 0.05
+"""The time in seconds between two checks for a response refreshed by another process."""
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given either in seconds or as an HTTP date.
+
+    Returns:
+        The time to wait in seconds, or `None` if the header is missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+
+    except ValueError:
+        pass
+
+    else:
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+    # a `-0000` zone gives a naive datetime, which is UTC as well
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
 
-    __slots__ = ("_session",)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _JsonArrayDecoder:
+    """Incrementally decodes the elements of a JSON array that is fed in chunks."""
+
+    __slots__ = ("_decoder", "_text", "_buffer", "_expect", "_finished")
 
     def __init__(self) -> None:
-        self._session = aiohttp.ClientSession()
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # what comes next: "[", the "first" element or "]", a "value" or a "delimiter"
+        self._expect = "["
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Feed the next chunk of the response body.
+
+        Returns:
+            The array elements which were completed by this chunk.
+
+        Raises:
+            ValueError: When the body is not a JSON array or is malformed.
+        """
+
+        buffer = self._buffer + self._text.decode(chunk)
+        items: list[Any] = []
+        pos = 0
+
+        while not self._finished:
+            pos = _WHITESPACE.match(buffer, pos).end()
+
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+
+            if self._expect == "[":
+                if char != "[":
+                    raise ValueError("Expected a JSON array.")
+
+                self._expect = "first"
+                pos += 1
+
+            elif self._expect == "delimiter":
+                if char == ",":
+                    self._expect = "value"
+
+                elif char == "]":
+                    self._finished = True
+
+                else:
+                    raise ValueError(
+                        f"Malformed JSON array, expected ',' or ']' at {char!r}."
+                    )
+
+                pos += 1
+
+            elif char == "]" and self._expect == "first":
+                self._finished = True
+                pos += 1
+
+            elif char in ",]":
+                raise ValueError(f"Malformed JSON array, expected a value at {char!r}.")
+
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+
+                except json.JSONDecodeError:
+                    # the element is not complete yet
+                    break
+
+                # a number is only complete once the delimiter after it has arrived,
+                # until then only a prefix of it like `12` of `12.5` may be decoded
+                delimiter = _WHITESPACE.match(buffer, end).end()
+
+                if delimiter == len(buffer):
+                    break
+
+                if buffer[delimiter] not in ",]":
+                    if delimiter == end and buffer[end] in _NUMBER_CHARS:
+                        break
+
+                    raise ValueError(
+                        f"Malformed JSON array, expected ',' or ']' at {buffer[delimiter]!r}."
+                    )
+
+                items.append(item)
+                self._expect = "delimiter"
+                pos = end
+
+        self._buffer = buffer[pos:]
+
+        return items
+
+    def close(self) -> None:
+        """Signal the end of the response body.
+
+        Raises:
+            ValueError: When the JSON array is incomplete.
+        """
+
+        if not self._finished:
+            raise ValueError("Incomplete JSON array.")
+
+
+class HttpService:
+    """The HTTP service that is used to make requets to API.
+
+    The session is created on the first request, so the service can be created outside
+    of a running event loop and `aiohttp` is only imported when it is needed.
+
+    Args:
+        cache: The optional cache used to serve repeated `GET` requests without a round trip.
+        connector: The optional connection pool settings.
+        session: The optional existing session to make the requests with. It is not
+            closed by [`close`][barch.HttpService.close] and can be shared with the rest
+            of the application.
+        json_loads: The optional function decoding the JSON response bodies from bytes.
+            Defaults to `orjson` or `msgspec` if installed, else the standard library `json`.
+        retry: The optional retry policy of all the routes. Without one, failed requests
+            are not retried.
+        route_retries: The optional retry policies of single routes, overriding `retry`.
+        rate_limiter: The optional rate limiter every request takes its tokens from.
+        instrumentation: The optional instrumentation recording the timing of every call.
+            With a given session, its network phases are only recorded if the session has
+            the [`trace_config`][barch.Instrumentation.trace_config] of the instrumentation.
+
+    Raises:
+        ValueError: When both a connector and a session are given.
+    """
+
+    __slots__ = (
+        "_session",
+        "_owns_session",
+        "_connector",
+        "_cache",
+        "_json_loads",
+        "_retry",
+        "_route_retries",
+        "_rate_limiter",
+        "_instrumentation",
+        "_in_flight",
+        "_refreshes",
+        "_ttl_hooks",
+    )
+
+    def __init__(
+        self,
+        cache: BaseCache | None = None,
+        connector: ConnectorConfig | None = None,
+        session: aiohttp.ClientSession | None = None,
+        json_loads: Callable[[bytes], Any] | None = None,
+        retry: RetryPolicy | None = None,
+        route_retries: Mapping[Route, RetryPolicy] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        if connector and session:
+            raise ValueError("Only one of connector and session can be specified.")
+
+        self._instrumentation = instrumentation
+        self._session = session
+        self._owns_session = session is None
+        self._connector = connector or ConnectorConfig()
+        self._cache = cache
+        self._json_loads = json_loads or _default_json_loads()
+        self._retry = retry
+        self._route_retries = dict(route_retries or {})
+        self._rate_limiter = rate_limiter
+        self._in_flight: dict[
+            str,
+            tuple[
+                asyncio.Future[HttpSuccessResponse | HttpErrorResponse],
+                RequestTiming | None,
+            ],
+        ] = {}
+        self._refreshes: set[
+            asyncio.Future[HttpSuccessResponse | HttpErrorResponse]
+        ] = set()
+        self._ttl_hooks: dict[Route, Callable[[HttpSuccessResponse], float | None]] = {}
+
+    @property
+    def cache(self) -> BaseCache | None:
+        """The response cache used by this service, if any."""
+
+        return self._cache
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """The instrumentation recording the timing of the calls, if any."""
+
+        return self._instrumentation
+
+    def _create_session(self, connector: ConnectorConfig) -> aiohttp.ClientSession:
+        """Create a session with a connection pool built from the given settings.
+
+        Returns:
+            The created session.
+        """
+
+        import aiohttp
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=connector.limit,
+                limit_per_host=connector.limit_per_host,
+                keepalive_timeout=connector.keepalive_timeout,
+                ttl_dns_cache=connector.ttl_dns_cache,
+            ),
+            trace_configs=[self._instrumentation.trace_config]
+            if self._instrumentation
+            else None,
+        )
+
+    def set_ttl_hook(
+        self, route: Route, hook: Callable[[HttpSuccessResponse], float | None]
+    ) -> None:
+        """Set the function computing the TTL of the cached responses of a route from their
+        content, like the time until the data is known to change. The route TTL of the cache
+        stays the ceiling.
+
+        Args:
+            route: The endpoint route, one of the routes in `barch.endpoints`.
+            hook: The function returning the TTL in seconds of a response, or `None` to use
+                the route TTL.
+        """
+
+        self._ttl_hooks[route] = hook
+
+    def _get_ttl(self, route: Route, response: HttpSuccessResponse) -> float:
+        """Get the TTL in seconds of a response to be cached.
+
+        Returns:
+            The TTL computed by the hook of the route, capped by the route TTL of the cache.
+        """
+
+        ttl = self._cache.get_ttl(route)
+        hook = self._ttl_hooks.get(route)
+
+        if hook is not None:
+            computed = hook(response)
+
+            if computed is not None:
+                ttl = max(0.0, min(ttl, computed))
+
+        return ttl
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the session, creating it on the first request.
+
+        Returns:
+            The session the requests are made with.
+        """
+
+        if self._session is None:
+            self._session = self._create_session(self._connector)
+
+        return self._session
 
     def _get_session_method(self, method: str, session: Any) -> Any:
         """Get the session with method type.
@@ -43,44 +357,436 @@ class HttpService:
         uri: str,
         params: dict[str, str | int],
         data: dict[str, str | int],
+        headers: dict[str, str] | None = None,
+        timing: RequestTiming | None = None,
+        decode: bool = True,
     ) -> HttpSuccessResponse | HttpErrorResponse:
         """Make the actual request to the MAL API based on given params.
 
         Returns:
-            The response from the API call."""
+            The response from the API call, a `304` is returned as a success response
+            without data. Without `decode`, a success response has the raw body only."""
 
         try:
-            async with session(uri, params=params, data=data) as r:
-                response = await r.json()
-                if r.status == 200:
-                    return HttpSuccessResponse(r.status, "Success.", response)
+            async with session(
+                uri,
+                params=params,
+                data=data,
+                headers=headers,
+                trace_request_ctx=timing,
+            ) as r:
+                if r.status == 304:
+                    return HttpSuccessResponse(r.status, "Not modified.", None)
+
+                start = time.perf_counter()
+                body = await r.read()
+
+                if timing is not None:
+                    timing.body_read = time.perf_counter() - start
+
+                if r.status != 200:
+                    try:
+                        message = self._json_loads(body).get("error")
+
+                    except Exception:
+                        message = r.reason
+
+                    return HttpErrorResponse(
+                        r.status,
+                        message,
+                        _parse_retry_after(r.headers.get("Retry-After"))
+                        if r.status in _RETRY_AFTER_STATUSES
+                        else None,
+                    )
 
-                return HttpErrorResponse(r.status, response.get("error"))
+                data = None
+
+                if decode:
+                    start = time.perf_counter()
+                    data = self._json_loads(body)
+
+                    if timing is not None:
+                        timing.json_decode = time.perf_counter() - start
+
+                return HttpSuccessResponse(
+                    r.status,
+                    "Success.",
+                    data,
+                    body,
+                    r.headers.get("ETag"),
+                    r.headers.get("Last-Modified"),
+                )
 
         except Exception as e:
             return HttpErrorResponse(500, str(e))
 
+    def _get_validators(self, entry: CacheEntry | None) -> dict[str, str] | None:
+        """Get the conditional request headers for revalidating a cached response.
+
+        Returns:
+            The `If-None-Match` and `If-Modified-Since` headers, or `None` if the
+            response has no validators.
+        """
+
+        if entry is None:
+            return None
+
+        headers = {}
+
+        if entry.response.etag:
+            headers["If-None-Match"] = entry.response.etag
+
+        if entry.response.last_modified:
+            headers["If-Modified-Since"] = entry.response.last_modified
+
+        return headers or None
+
+    async def _acquire(self, route: Route) -> bool:
+        """Take the rate limiter tokens for a request to the route, if there is a rate limiter.
+
+        Returns:
+            `False` if the rate limiter does not block and has no tokens available, else `True`.
+        """
+
+        if self._rate_limiter is None:
+            return True
+
+        if not self._rate_limiter.block:
+            return self._rate_limiter.try_acquire(route)
+
+        await self._rate_limiter.acquire(route)
+
+        return True
+
+    async def _send(
+        self,
+        route: GenerateRoute,
+        timing: RequestTiming | None = None,
+        decode: bool = True,
+    ) -> HttpSuccessResponse | HttpErrorResponse:
+        """Send the request for the given route and cache the response if it is cacheable.
+
+        An expired cached response with validators is revalidated with a conditional request,
+        and reused as is if the API answers `304 Not Modified`. Requests wait for the rate
+        limiter and failed requests are retried according to the retry policy of the route,
+        except the client side `429` of a non-blocking rate limiter, which is returned right
+        away. The network phases of the last attempt are recorded into the given timing.
+
+        Returns:
+            The HTTP response [`HttpSuccessResponse`] or [`HttpErrorResponse`] of the API call.
+        """
+        cacheable = self._cache is not None and route.method == "GET"
+        entry = await self._cache.get_entry_async(route.key) if cacheable else None
+        retry = self._route_retries.get(route.route, self._retry)
+        start = time.perf_counter()
+        attempt = 1
+
+        while True:
+            limited = False
+
+            try:
+                if await self._acquire(route.route):
+                    response = await self._request(
+                        self._get_session_method(route.method, self._get_session()),
+                        route.uri,
+                        route.params,
+                        route.data,
+                        self._get_validators(entry),
+                        timing,
+                        decode,
+                    )
+
+                else:
+                    limited = True
+                    response = HttpErrorResponse(
+                        429, "Client side rate limit exceeded."
+                    )
+
+            except Exception as e:
+                response = HttpErrorResponse(500, str(e))
+
+            if isinstance(response, HttpSuccessResponse):
+                break
+
+            delay = (
+                retry.get_delay(attempt, response.retry_after)
+                if retry is not None
+                and not limited
+                and attempt < retry.max_attempts
+                and route.method in retry.methods
+                and response.status in retry.statuses
+                else None
+            )
+
+            if delay is None:
+                response.attempts = attempt
+                response.elapsed = time.perf_counter() - start
+
+                return response
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if isinstance(response, HttpSuccessResponse) and response.status == 304:
+            if entry is None:
+                return HttpErrorResponse(304, "Not modified without a cached response.")
+
+            response = entry.response
+
+        if cacheable and isinstance(response, HttpSuccessResponse):
+            await self._cache.set_async(
+                route.key, response, self._get_ttl(route.route, response)
+            )
+
+        return response
+
     async def fetch(
-        self, route: GenerateRoute
+        self, route: GenerateRoute, decode: bool = True
     ) -> HttpSuccessResponse | HttpErrorResponse:
         """Makes a request to the given route.
 
+        Concurrent `GET` requests for the same route share a single in-flight request
+        and all receive its response.
+
+        Args:
+            route: The route to request.
+            decode: If `False`, the body of a new response is not decoded and its `data`
+                is `None` until it is passed to [`decode`][barch.HttpService.decode].
+
+        With instrumentation, the timing of an error response is finished right away, the
+        one of a success response when the calling service has deserialized it.
+
         Returns:
             The HTTP response [`HttpSuccessResponse`] or [`HttpErrorResponse`] of the API call.
         """
+        timing = self._instrumentation.start(route) if self._instrumentation else None
+        response = await self._fetch(route, timing, decode)
+
+        if timing is not None:
+            self._instrumentation.complete(timing, response)
+
+        return response
+
+    def _get_in_flight(
+        self, route: GenerateRoute, timing: RequestTiming | None, decode: bool
+    ) -> tuple[
+        asyncio.Future[HttpSuccessResponse | HttpErrorResponse], RequestTiming | None
+    ]:
+        """Get the in-flight request of the given route, sending a new one if there is none.
+
+        Returns:
+            The request task and the timing of the call which sent it.
+        """
+
+        key = route.key
+        task, leader = self._in_flight.get(key, (None, None))
+
+        if task is None:
+            leader = timing
+            task = asyncio.ensure_future(self._refresh(route, timing, decode))
+            self._in_flight[key] = (task, leader)
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return task, leader
+
+    async def _refresh(
+        self, route: GenerateRoute, timing: RequestTiming | None, decode: bool
+    ) -> HttpSuccessResponse | HttpErrorResponse:
+        """Send a request for the given route. With a cache shared between processes, only
+        the process holding the lease of the route sends it, while the others wait for the
+        refreshed response in the cache.
+
+        Returns:
+            The HTTP response [`HttpSuccessResponse`] or [`HttpErrorResponse`] of the API call.
+        """
+
+        cache = self._cache
+
+        if cache is None or not cache.is_shared:
+            return await self._send(route, timing, decode)
+
+        key = route.key
+
+        while not await cache.acquire_lease_async(key):
+            await asyncio.sleep(_LEASE_POLL_INTERVAL)
+            entry = await cache.get_entry_async(key)
+
+            if entry is not None and entry.is_fresh:
+                return entry.response
+
         try:
-            return await self._request(
-                self._get_session_method(route.method, self._session),
-                route.uri,
-                route.params,
-                route.data,
-            )
+            # another process may have refreshed it between the lookup and the lease
+            entry = await cache.get_entry_async(key)
+
+            if entry is not None and entry.is_fresh:
+                return entry.response
+
+            return await self._send(route, timing, decode)
+
+        finally:
+            await cache.release_lease_async(key)
+
+    async def _fetch(
+        self, route: GenerateRoute, timing: RequestTiming | None, decode: bool
+    ) -> HttpSuccessResponse | HttpErrorResponse:
+        """Get the response of the given route from the cache, an in-flight request or a new request.
+
+        An expired cached response within the max staleness of the cache is returned right
+        away, while a single background request refreshes it.
+
+        Returns:
+            The HTTP response [`HttpSuccessResponse`] or [`HttpErrorResponse`] of the API call.
+        """
+
+        if route.method != "GET":
+            return await self._send(route, timing, decode)
+
+        key = route.key
+
+        if self._cache is not None:
+            entry = await self._cache.lookup_async(key)
+
+            if entry is not None:
+                stale = not entry.is_fresh
+
+                if stale:
+                    task, _ = self._get_in_flight(route, None, decode)
+                    self._refreshes.add(task)
+                    task.add_done_callback(self._refreshes.discard)
+
+                if timing is not None:
+                    timing.cached = True
+                    timing.stale = stale
+
+                return entry.response
+
+        task, leader = self._get_in_flight(route, timing, decode)
+
+        # shielded so a cancelled caller does not cancel the request for the others
+        response = await asyncio.shield(task)
+
+        if timing is not None and timing is not leader:
+            timing.coalesced = True
+
+            if leader is not None:
+                timing.copy_network(leader)
+
+        return response
+
+    async def prefetch(
+        self, route: GenerateRoute
+    ) -> HttpSuccessResponse | HttpErrorResponse | None:
+        """Stores a fresh response of the given route in the cache, without decoding it,
+        unless the cache already has one. Unlike [`fetch`][barch.HttpService.fetch], an
+        expired response is never served, the refreshed response is waited for.
+
+        Args:
+            route: The route to request.
+
+        Returns:
+            The HTTP response [`HttpSuccessResponse`] or [`HttpErrorResponse`] of the API call,
+                or `None` if the cached response is still fresh.
+
+        Raises:
+            ValueError: When the service has no cache.
+        """
+
+        if self._cache is None:
+            raise ValueError("A cache is required to prefetch responses.")
+
+        entry = await self._cache.get_entry_async(route.key)
+
+        if entry is not None and entry.is_fresh:
+            return None
+
+        task, _ = self._get_in_flight(route, None, False)
+
+        # shielded so a cancelled prefetch does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def decode(self, response: HttpSuccessResponse, keep: bool = True) -> Any:
+        """Get the decoded data of a response, decoding its raw body if it was fetched
+        without decoding. The decoded data is kept on the response for the next calls.
+
+        Args:
+            response: The success response.
+            keep: If `False`, the data decoded from the raw body is not kept on the response,
+                which stays undecoded.
+
+        Returns:
+            The decoded JSON data.
+        """
+
+        if response.data is None and response.body is not None:
+            data = self._json_loads(response.body)
+
+            if keep:
+                response.data = data
+
+            return data
+
+        return response.data
+
+    async def stream(self, route: GenerateRoute) -> AsyncIterator[Any]:
+        """Makes a request to a route returning a JSON array and yields its elements as they are decoded.
+
+        A fresh cached response is streamed from the cache, but streamed responses are not stored
+        in it, as that would keep the whole array in memory. The request waits for the rate
+        limiter like every other request, but it is not retried, as elements may already
+        have been yielded when it fails.
+
+        Yields:
+            The decoded array elements, or a single [`HttpErrorResponse`] if the request fails.
+        """
+
+        if self._cache is not None and route.method == "GET":
+            cached = await self._cache.get_async(route.key)
+
+            if cached is not None:
+                for item in self.decode(cached):
+                    yield item
+
+                return
+
+        if not await self._acquire(route.route):
+            yield HttpErrorResponse(429, "Client side rate limit exceeded.")
+            return
+
+        try:
+            async with self._get_session_method(route.method, self._get_session())(
+                route.uri, params=route.params, data=route.data
+            ) as r:
+                if r.status != 200:
+                    try:
+                        message = self._json_loads(await r.read()).get("error")
+
+                    except Exception:
+                        message = r.reason
+
+                    yield HttpErrorResponse(r.status, message)
+                    return
+
+                decoder = _JsonArrayDecoder()
+
+                async for chunk in r.content.iter_any():
+                    for item in decoder.feed(chunk):
+                        yield item
+
+                decoder.close()
 
         except Exception as e:
-            return HttpErrorResponse(500, str(e))
+            yield HttpErrorResponse(500, str(e))
 
     async def close(self) -> None:
-        """Close the open aiohttp clientsession."""
+        """Close the open aiohttp clientsession, unless it was passed in by the user.
+        Pending background refreshes of stale responses are cancelled."""
+
+        for task in list(self._refreshes):
+            task.cancel()
 
-        if self._session and not self._session.closed:
+        if (
+            self._owns_session
+            and self._session is not None
+            and not self._session.closed
+        ):
             await self._session.close()
@@ -1,9 +1,13 @@
 """Module for raid service."""
 
 from __future__ import annotations
-from typing import TypeVar
+from typing import Any, TypeVar
+import copy
+import time
 
-from .base import BaseService
+from .base import BaseService, RawT
+from barch.services import HttpService
+from barch import serializer
 from barch.result import Result, Success, Error
 from barch.models import HttpSuccessResponse, HttpErrorResponse, Raids
 from barch import endpoints
@@ -15,48 +19,163 @@ ResultT = Result[ValueT, HttpErrorResponse]
 
 __all__ = ("RaidService",)
 
+_OUTDATED_TTL = 60.0
+"""The TTL in seconds of a raid response which misses a raid transition that already happened."""
+
+_TRANSITION_KEYS = ("startAt", "settleAt", "endAt")
+"""The keys of the raids payload holding the times at which the raids change."""
+
+_RAID_LISTS = ("current", "upcoming", "ended")
+"""The attributes of the `Raids` model holding lists of raids."""
+
+
+def _timestamp(value: Any) -> float | None:
+    """Converts a unix timestamp in milliseconds of the raids payload to seconds."""
+
+    return value / 1000 if value else None
+
+
+def _copy_raids(raids: Raids) -> Raids:
+    """Copies a `Raids` model with new lists, so a caller can sort or extend them without
+    changing what the next callers served by the same response receive."""
+
+    raids = copy.copy(raids)
+
+    for name in _RAID_LISTS:
+        value = getattr(raids, name)
+
+        if value is not None:
+            setattr(raids, name, list(value))
+
+    return raids
+
 
 class RaidService(BaseService):
-    """The service that handles all the methods related to raids."""
+    """The service that handles all the methods related to raids.
+
+    With a cache, a raids response expires at the next start, settle or end of its raids,
+    so it is served from the cache until the raids change and refetched right after. The
+    route TTL of the cache stays the ceiling, for raids which are announced later.
+
+    With a cache, every call gets its own `Raids` model and lists, which can be sorted or
+    extended, but the `Raid` models in them are shared by every call served by the same
+    response, so they must not be modified.
+    """
 
     __slots__ = ()
 
-    async def _get_raids(self, is_jp: bool = False) -> ResultT[list[Raids]]:
+    def __init__(
+        self, http_service: HttpService, serializer: serializer.Serializer
+    ) -> None:
+        super().__init__(http_service, serializer)
+
+        for route in (endpoints.GET_RAIDS, endpoints.GET_RAIDS_JP):
+            http_service.set_ttl_hook(route, self._get_ttl)
+
+    def _get_ttl(self, response: HttpSuccessResponse) -> float | None:
+        """Get the time until the next raid transition of a raids response, from its JSON
+        data, so the response is neither deserialized nor kept decoded.
+
+        Returns:
+            The time in seconds until the next start, settle or end of a raid, a short TTL
+            if the response misses a transition that already happened, or `None` if no
+            transition is scheduled.
+        """
+
+        data = self._http.decode(response, keep=False)
+
+        if not isinstance(data, dict):
+            return None
+
+        current = data.get("current") or ()
+        upcoming = data.get("upcoming") or ()
+        now = time.time()
+
+        for raid in current:
+            if (_timestamp(raid.get("endAt")) or now) < now:
+                return _OUTDATED_TTL
+
+        for raid in upcoming:
+            if (_timestamp(raid.get("startAt")) or now) < now:
+                return _OUTDATED_TTL
+
+        transitions = [
+            at
+            for raid in (*current, *upcoming)
+            for at in map(_timestamp, (raid.get(key) for key in _TRANSITION_KEYS))
+            if at is not None and at > now
+        ]
+
+        return min(transitions) - now if transitions else None
+
+    async def _get_raids(
+        self, is_jp: bool = False, raw: RawT | None = None
+    ) -> ResultT[list[Raids] | bytes | dict[str, Any]]:
         """Internal method for getting raid details which is used by both EN and JP version.
         
         Keyword Args:
             is_jp: The optional boolean flag, which specifies if the raid details need to 
                 be fetched for the EN or JP version.
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
         
         Returns:
             [`Result`][barch.Result] containing `list[Raids]` on success or error data on error.
+
+        Raises:
+            ValueError: When the raw mode is invalid.
         """
 
+        decode = self._should_decode(raw)
+
         if is_jp:
             route = endpoints.GET_RAIDS_JP.generate_route()
         else:
             route = endpoints.GET_RAIDS.generate_route()
-        result = await self._http.fetch(route)
+        result = await self._http.fetch(route, decode)
 
         if isinstance(result, HttpErrorResponse):
             return Error(result)
 
-        return Success(self._serializer.deserialize_raids(result.data))
+        if raw:
+            return Success(self._raw(result, raw))
+
+        raids = self._deserialize(result, "raids", self._serializer.deserialize_raids)
+
+        return Success(_copy_raids(raids))
 
-    async def get_raids(self) -> ResultT[list[Raids]]:
+    async def get_raids(
+        self, raw: RawT | None = None
+    ) -> ResultT[list[Raids] | bytes | dict[str, Any]]:
         """Gets all the current, upcoming and ended raid details EN version.
+
+        Keyword Args:
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
         
         Returns:
             [`Result`][barch.Result] containing `list[Raids]` on success or error data on error.
+
+        Raises:
+            ValueError: When the raw mode is invalid.
         """
 
-        return await self._get_raids()
+        return await self._get_raids(raw=raw)
 
-    async def get_raids_jp(self) -> ResultT[list[Raids]]:
+    async def get_raids_jp(
+        self, raw: RawT | None = None
+    ) -> ResultT[list[Raids] | bytes | dict[str, Any]]:
         """Gets all the current, upcoming and ended raid details JP version.
+
+        Keyword Args:
+            raw: The optional raw mode, `"bytes"` for the undecoded response body or `"json"`
+                for the decoded JSON data, which must not be modified, instead of models.
         
         Returns:
             [`Result`][barch.Result] containing `list[Raids]` on success or error data on error.
+
+        Raises:
+            ValueError: When the raw mode is invalid.
         """
 
-        return await self._get_raids(is_jp=True)
+        return await self._get_raids(is_jp=True, raw=raw)
@@ -0,0 +1,253 @@
+"""This module has the synchronous client, backed by an event loop running in a background thread."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Mapping, TypeVar
+
+from barch.cache import BaseCache
+from barch.client import Client
+from barch.models import ConnectorConfig, RetryPolicy, Route, WarmupReport
+from barch.ratelimit import RateLimiter
+from barch.timing import Instrumentation, TimingStats
+
+T = TypeVar("T")
+
+__all__ = ("SyncClient",)
+
+
+class _EventLoopThread:
+    """An event loop running forever in a daemon thread, which runs coroutines submitted
+    from any other thread."""
+
+    __slots__ = ("_loop", "_thread")
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="barch-event-loop", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the event loop is still running."""
+
+        return self._thread.is_alive()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the event loop and wait for its result.
+
+        Raises:
+            RuntimeError: When called from the event loop thread, which would deadlock,
+                or after the event loop is stopped.
+        """
+
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("SyncClient can not be used from its own event loop.")
+
+        if not self.is_running:
+            coroutine.close()
+            raise RuntimeError("SyncClient is closed.")
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Iterate an async iterator on the event loop, one element at a time."""
+
+        async def next_element() -> T:
+            return await iterator.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield self.run(next_element())
+
+                except StopAsyncIteration:
+                    return
+
+        finally:
+            close = getattr(iterator, "aclose", None)
+
+            if close is not None and self.is_running:
+                self.run(close())
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for its thread to finish."""
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _SyncService:
+    """Mirrors every public method of an asynchronous service as a blocking call. Methods
+    returning an async iterator return a regular iterator instead."""
+
+    __slots__ = ("_service", "_loop", "_methods")
+
+    def __init__(self, service: Any, loop: _EventLoopThread) -> None:
+        self._service = service
+        self._loop = loop
+        self._methods: dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        method = self._methods.get(name)
+
+        if method is not None:
+            return method
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        attr = getattr(self._service, name)
+
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+
+            if inspect.iscoroutine(result):
+                return self._loop.run(result)
+
+            if hasattr(result, "__anext__"):
+                return self._loop.iterate(result)
+
+            return result
+
+        self._methods[name] = blocking
+
+        return blocking
+
+    def __dir__(self) -> list[str]:
+        return [name for name in dir(self._service) if not name.startswith("_")]
+
+
+class SyncClient:
+    """A synchronous client used to interact with the BlueArchive API, for code which can
+    not run an event loop itself.
+
+    A single event loop runs in a background thread for the lifetime of the client, with
+    a single [`Client`][barch.Client] and its connection pool, cache and rate limiter.
+    The [`character`][barch.SyncClient.character] and [`raid`][barch.SyncClient.raid]
+    services mirror every method of [`CharacterService`][barch.CharacterService] and
+    [`RaidService`][barch.RaidService] as a blocking call, and the `iter_*` methods return
+    regular iterators. The client can be used from many threads at once.
+
+    Args:
+        cache: The optional cache used to serve repeated requests, either the in-memory
+            [`ResponseCache`][barch.ResponseCache], the persistent [`SQLiteCache`][barch.SQLiteCache]
+            or the [`SharedCache`][barch.SharedCache] shared between processes.
+        connector: The optional [`ConnectorConfig`][barch.ConnectorConfig] with the connection
+            pool settings.
+        lazy: If `True`, the sub-models of `CharacterDetails` are only deserialized on first
+            access, see [`LazyCharacterDetails`][barch.LazyCharacterDetails].
+        json_loads: The optional function decoding the JSON response bodies from bytes.
+            Defaults to `orjson` or `msgspec` if installed, else the standard library `json`.
+        retry: The optional [`RetryPolicy`][barch.RetryPolicy] of all the routes. Without one,
+            failed requests are not retried.
+        route_retries: The optional retry policies of single routes from `barch.endpoints`,
+            overriding `retry`.
+        rate_limiter: The optional [`RateLimiter`][barch.RateLimiter] shared by all the requests
+            of the client.
+        instrumentation: The optional [`Instrumentation`][barch.Instrumentation] recording the
+            per phase timing of every call.
+
+    ??? example
+
+        ```py
+        from barch import SyncClient
+
+        with SyncClient() as client:
+            result = client.character.get_character(id=10000)
+
+            if result.is_success:
+                character = result.value
+
+            for id, result in client.character.iter_characters(ids=[10000, 10001]):
+                if result.is_success:
+                    print(id, result.value)
+        ```
+    """
+
+    __slots__ = ("_loop", "_client", "_character", "_raid")
+
+    def __init__(
+        self,
+        cache: BaseCache | None = None,
+        connector: ConnectorConfig | None = None,
+        lazy: bool = False,
+        json_loads: Callable[[bytes], Any] | None = None,
+        retry: RetryPolicy | None = None,
+        route_retries: Mapping[Route, RetryPolicy] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self._loop = _EventLoopThread()
+        self._client = Client(
+            cache,
+            connector,
+            None,
+            lazy,
+            json_loads,
+            retry,
+            route_retries,
+            rate_limiter,
+            instrumentation,
+        )
+        self._character = _SyncService(self._client.character, self._loop)
+        self._raid = _SyncService(self._client.raid, self._loop)
+
+    @property
+    def character(self) -> Any:
+        """The blocking [`CharacterService`][barch.CharacterService] used to make character related requests."""
+
+        return self._character
+
+    @property
+    def raid(self) -> Any:
+        """The blocking [`RaidService`][barch.RaidService] used to make raid related requests."""
+
+        return self._raid
+
+    @property
+    def timings(self) -> dict[str, TimingStats]:
+        """The rolling timing statistics of every endpoint by uri template, empty without instrumentation."""
+
+        return self._client.timings
+
+    def warmup(
+        self,
+        concurrency: int = 10,
+        on_progress: Callable[[WarmupReport], Any] | None = None,
+        budget: float | None = None,
+    ) -> WarmupReport:
+        """Fill the cache with the rosters, raids and character details, see
+        [`Client.warmup`][barch.Client.warmup]. The progress function is called from the
+        background event loop thread.
+
+        Raises:
+            ValueError: When the client has no cache or the concurrency is less than 1.
+        """
+
+        return self._loop.run(self._client.warmup(concurrency, on_progress, budget))
+
+    def close(self) -> None:
+        """Close the client session and stop the background event loop. Calling it again
+        does nothing."""
+
+        if self._loop.is_running:
+            self._loop.run(self._client.close())
+            self._loop.stop()
+
+    def __enter__(self) -> SyncClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,487 @@
+"""Module for the columnar character table used for analytics over rosters."""
+
+from __future__ import annotations
+
+import itertools
+from array import array
+from collections import Counter
+from typing import Any, Callable, Iterable, Mapping
+
+from barch.index import FilterT, Not, _normalize
+
+__all__ = ("CharacterTable",)
+
+_INT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "id": ("id",),
+    "base_star": ("baseStar",),
+}
+"""The integer columns and the path of their value in the roster payload."""
+
+_STRING_COLUMNS: dict[str, tuple[str, ...]] = {
+    "is_released": ("isReleased",),
+    "name": ("name",),
+    "profile": ("profile",),
+    "rarity": ("rarity",),
+    "position": ("position",),
+    "role": ("role",),
+    "armor_type": ("armorType",),
+    "bullet_type": ("bulletType",),
+    "weapon_type": ("weaponType",),
+    "squad_type": ("squadType",),
+    "school": ("school",),
+    **{
+        f"{terrain}_{column}": ("terrain", terrain, key)
+        for terrain in ("urban", "outdoor", "indoor")
+        for column, key in (
+            ("damage_dealt", "DamageDealt"),
+            ("shield_block_rate", "ShieldBlockRate"),
+        )
+    },
+}
+"""The dictionary encoded string and boolean columns and the path of their value in the
+roster payload."""
+
+_MISSING = -1
+"""The value stored for a missing number in an integer column."""
+
+
+def _compile_extractor(
+    paths: Iterable[tuple[str, ...]]
+) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    """Generate a function getting the values at the given paths of a roster character.
+
+    Every nested object is looked up once per character, and a missing or invalid one
+    gives `None` for all the values in it.
+
+    Returns:
+        The generated function, returning the values in the order of the paths.
+    """
+
+    paths = list(paths)
+    parents = sorted(
+        {path[:depth] for path in paths for depth in range(1, len(path))}, key=len
+    )
+    names: dict[tuple[str, ...], str] = {(): "data"}
+    lines = ["def extract(data):"]
+
+    for index, parent in enumerate(parents):
+        name = names[parent] = f"parent_{index}"
+        lines.append(f"    {name} = {names[parent[:-1]]}.get({parent[-1]!r})")
+        lines.append(f"    {name} = {name} if {name}.__class__ is dict else _EMPTY")
+
+    values = ", ".join(f"{names[path[:-1]]}.get({path[-1]!r})" for path in paths)
+    lines.append(f"    return ({values},)")
+
+    namespace: dict[str, Any] = {"_EMPTY": {}}
+    exec("\n".join(lines), namespace)
+
+    return namespace["extract"]
+
+
+_extract = _compile_extractor((*_INT_COLUMNS.values(), *_STRING_COLUMNS.values()))
+"""Gets the values of all the columns of a roster character, integer columns first."""
+
+
+def _typecode(size: int) -> str:
+    """Get the smallest array typecode holding the codes of a dictionary of the given size."""
+
+    if size <= 1 << 8:
+        return "B"
+
+    if size <= 1 << 16:
+        return "H"
+
+    return "L"
+
+
+class CharacterTable:
+    """A columnar table of the character roster, built straight from the API payload
+    without creating a model per character.
+
+    Every field of `Character` is stored as a compact array: the numbers as 64 bit
+    integers, with `-1` for a missing number, and the strings and booleans dictionary
+    encoded as small integer codes into a list of their distinct values. The terrain is
+    flattened into the `urban_damage_dealt`, `urban_shield_block_rate`, ... columns.
+    Filters and counts work on the codes, so most of the work runs in C instead of per
+    character Python code.
+
+    Building a table takes a single generated function call per character, with the
+    columns transposed and encoded in C, so it is faster than building the `Character`
+    models and keeps about a sixth of their memory.
+
+    Args:
+        length: The number of rows.
+        ints: The integer columns.
+        codes: The codes of the string columns.
+        dictionaries: The distinct values of the string columns, indexed by code.
+
+    ??? example
+
+        ```py
+        from barch import Client, Not
+
+        client = Client()
+
+        result = await client.character.get_character_table()
+
+        if result.is_success:
+            table = result.value
+            by_school = table.value_counts("school")
+            front_liners = table.filter(position="Front", armor_type=Not("Light"))
+
+        await client.close()
+        ```
+    """
+
+    __slots__ = ("_length", "_ints", "_codes", "_dictionaries")
+
+    def __init__(
+        self,
+        length: int,
+        ints: dict[str, array[int]],
+        codes: dict[str, array[int]],
+        dictionaries: dict[str, list[Any]],
+    ) -> None:
+        self._length = length
+        self._ints = ints
+        self._codes = codes
+        self._dictionaries = dictionaries
+
+    @classmethod
+    def from_payload(cls, data: Iterable[Mapping[str, Any]]) -> CharacterTable:
+        """Build a table from the JSON payload of the character roster.
+
+        Args:
+            data: The decoded roster payload, a list of character objects.
+
+        Returns:
+            The table with a row per character, in payload order.
+        """
+
+        rows = list(map(_extract, data))
+        columns = (
+            zip(*rows) if rows else ((),) * (len(_INT_COLUMNS) + len(_STRING_COLUMNS))
+        )
+        ints: dict[str, array[int]] = {}
+        codes: dict[str, array[int]] = {}
+        dictionaries: dict[str, list[Any]] = {}
+
+        for column, values in zip(_INT_COLUMNS, columns):
+            ints[column] = array(
+                "q", [_MISSING if value is None else value for value in values]
+            )
+
+        for column, values in zip(_STRING_COLUMNS, columns):
+            dictionary = list(dict.fromkeys(values))
+            lookup = dict(zip(dictionary, range(len(dictionary))))
+            typecode = _typecode(len(dictionary))
+            encoded = map(lookup.__getitem__, values)
+            # bytes are built in a single C loop, an array is appended to per code
+            codes[column] = array(
+                typecode, bytes(encoded) if typecode == "B" else list(encoded)
+            )
+            dictionaries[column] = dictionary
+
+        return cls(len(rows), ints, codes, dictionaries)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """The names of the columns."""
+
+        return (*_INT_COLUMNS, *_STRING_COLUMNS)
+
+    def _check_column(self, column: str) -> None:
+        """Raise a `ValueError` if the column does not exist."""
+
+        if column not in self._ints and column not in self._codes:
+            raise ValueError(f"Unknown column {column!r}.")
+
+    def column(self, column: str) -> list[Any]:
+        """Get the decoded values of a column.
+
+        Args:
+            column: The column name, one of [`columns`][barch.CharacterTable.columns].
+
+        Returns:
+            The values in row order, `None` for the missing ones.
+
+        Raises:
+            ValueError: When the column does not exist.
+        """
+
+        self._check_column(column)
+
+        if column in self._ints:
+            return [
+                None if value == _MISSING else value for value in self._ints[column]
+            ]
+
+        return list(map(self._dictionaries[column].__getitem__, self._codes[column]))
+
+    def codes(self, column: str) -> array[int]:
+        """Get the codes of a string column, indexes into its [`dictionary`][barch.CharacterTable.dictionary].
+
+        Args:
+            column: The string column name.
+
+        Returns:
+            The codes in row order.
+
+        Raises:
+            ValueError: When the column is not a string column.
+        """
+
+        if column not in self._codes:
+            raise ValueError(f"Unknown string column {column!r}.")
+
+        return self._codes[column]
+
+    def dictionary(self, column: str) -> list[Any]:
+        """Get the distinct values of a string column, indexed by code. A filtered table
+        shares the dictionaries of its source, so they can contain unused values.
+
+        Args:
+            column: The string column name.
+
+        Returns:
+            The values, `None` included if some rows have no value.
+
+        Raises:
+            ValueError: When the column is not a string column.
+        """
+
+        if column not in self._dictionaries:
+            raise ValueError(f"Unknown string column {column!r}.")
+
+        return self._dictionaries[column]
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Get a single row.
+
+        Args:
+            index: The row index, negative indexes count from the end.
+
+        Returns:
+            The values of the row by column name.
+
+        Raises:
+            IndexError: When the index is out of range.
+        """
+
+        row: dict[str, Any] = {}
+
+        for column, values in self._ints.items():
+            value = values[index]
+            row[column] = None if value == _MISSING else value
+
+        for column, codes in self._codes.items():
+            row[column] = self._dictionaries[column][codes[index]]
+
+        return row
+
+    def _mask(self, column: str, filter: FilterT) -> int:
+        """Get the rows matching a filter as a little endian integer with a byte per row,
+        `1` for a match and `0` otherwise."""
+
+        self._check_column(column)
+
+        negate = isinstance(filter, Not)
+        values = filter.values if negate else filter
+
+        if isinstance(values, str) or not isinstance(values, Iterable):
+            values = (values,)
+
+        if column in self._ints:
+            allowed = set(values)
+            matches = bytes(map(allowed.__contains__, self._ints[column]))
+
+        else:
+            wanted = {_normalize(value) for value in values}
+            lookup = bytes(
+                value is not None and _normalize(value) in wanted
+                for value in self._dictionaries[column]
+            )
+            matches = bytes(map(lookup.__getitem__, self._codes[column]))
+
+        mask = int.from_bytes(matches, "little")
+
+        if negate:
+            mask ^= int.from_bytes(b"\x01" * self._length, "little")
+
+        return mask
+
+    def take(self, indexes: Iterable[int]) -> CharacterTable:
+        """Get a table of the given rows.
+
+        Args:
+            indexes: The row indexes, in the order of the new table.
+
+        Returns:
+            The new table, sharing the dictionaries of this one.
+        """
+
+        indexes = list(indexes)
+
+        return CharacterTable(
+            len(indexes),
+            {
+                column: array("q", map(values.__getitem__, indexes))
+                for column, values in self._ints.items()
+            },
+            {
+                column: array(codes.typecode, map(codes.__getitem__, indexes))
+                for column, codes in self._codes.items()
+            },
+            self._dictionaries,
+        )
+
+    def filter(self, **filters: FilterT) -> CharacterTable:
+        """Get the rows matching all the given filters, by column name.
+        Atleast one filter must be specified. Every filter takes a single value, a collection
+        of values matching any of them, or [`Not`][barch.Not] to exclude values. Strings
+        and enums are matched case insensitively, numbers exactly.
+
+        Keyword Args:
+            **filters: The filters by column name, like `school="Gehenna"` or `base_star=[2, 3]`.
+
+        Returns:
+            The table of the matching rows, in the same order.
+
+        Raises:
+            ValueError: When no filters are given or a column does not exist.
+        """
+
+        if not filters:
+            raise ValueError("Atleast one parameter must be specified.")
+
+        mask = int.from_bytes(b"\x01" * self._length, "little")
+
+        for column, filter in filters.items():
+            mask &= self._mask(column, filter)
+
+        matches = mask.to_bytes(self._length, "little")
+
+        return self.take(itertools.compress(range(self._length), matches))
+
+    def _keys(self, columns: tuple[str, ...]) -> Iterable[Any]:
+        """Get the encoded group key of every row, a single value for a single column."""
+
+        if not columns:
+            raise ValueError("Atleast one parameter must be specified.")
+
+        for column in columns:
+            self._check_column(column)
+
+        arrays = [self._codes.get(column, self._ints.get(column)) for column in columns]
+
+        return arrays[0] if len(arrays) == 1 else zip(*arrays)
+
+    def _decode(self, columns: tuple[str, ...], key: Any) -> Any:
+        """Decode an encoded group key."""
+
+        if len(columns) == 1:
+            key = (key,)
+
+        decoded = tuple(
+            self._dictionaries[column][value]
+            if column in self._codes
+            else None
+            if value == _MISSING
+            else value
+            for column, value in zip(columns, key)
+        )
+
+        return decoded[0] if len(columns) == 1 else decoded
+
+    def value_counts(self, *columns: str) -> dict[Any, int]:
+        """Count the rows of every distinct value, or combination of values, of the columns.
+
+        Args:
+            *columns: The column names.
+
+        Returns:
+            The number of rows by value, or by tuple of values for multiple columns,
+            the most common first.
+
+        Raises:
+            ValueError: When no columns are given or a column does not exist.
+        """
+
+        counts = Counter(self._keys(columns))
+
+        return {
+            self._decode(columns, key): count for key, count in counts.most_common()
+        }
+
+    def group_by(self, *columns: str) -> dict[Any, CharacterTable]:
+        """Split the rows by every distinct value, or combination of values, of the columns.
+
+        Args:
+            *columns: The column names.
+
+        Returns:
+            The table of the rows of every value, or tuple of values for multiple columns,
+            in order of first appearance.
+
+        Raises:
+            ValueError: When no columns are given or a column does not exist.
+        """
+
+        groups: dict[Any, list[int]] = {}
+
+        for index, key in enumerate(self._keys(columns)):
+            groups.setdefault(key, []).append(index)
+
+        return {
+            self._decode(columns, key): self.take(indexes)
+            for key, indexes in groups.items()
+        }
+
+    def to_numpy(self, *columns: str) -> dict[str, Any]:
+        """Export columns to NumPy arrays. Requires NumPy to be installed.
+
+        Integer columns are exported as `int64` arrays, with `-1` for missing numbers, and
+        string columns as `object` arrays of their decoded values.
+
+        Args:
+            *columns: The column names, all the columns by default.
+
+        Returns:
+            The `numpy.ndarray` of every column by name.
+
+        Raises:
+            ImportError: When NumPy is not installed.
+            ValueError: When a column does not exist.
+        """
+
+        try:
+            import numpy
+
+        except ImportError:
+            raise ImportError(
+                "NumPy is required to export to NumPy arrays, install it with `pip install numpy`."
+            ) from None
+
+        exported = {}
+
+        for column in columns or self.columns:
+            self._check_column(column)
+
+            if column in self._ints:
+                exported[column] = numpy.frombuffer(
+                    self._ints[column], dtype=numpy.int64
+                ).copy()
+
+            else:
+                dictionary = numpy.empty(len(self._dictionaries[column]), dtype=object)
+                dictionary[:] = self._dictionaries[column]
+                exported[column] = dictionary[
+                    numpy.frombuffer(
+                        self._codes[column], dtype=self._codes[column].typecode
+                    )
+                ]
+
+        return exported
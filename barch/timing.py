@@ -0,0 +1,359 @@
+"""Module for the request timing instrumentation of the HTTP service."""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable
+
+import attrs
+
+from barch.models import GenerateRoute, HttpSuccessResponse, HttpErrorResponse
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = ("RequestTiming", "TimingStats", "Instrumentation")
+
+_PHASES = (
+    "queued",
+    "dns",
+    "connect",
+    "ttfb",
+    "body_read",
+    "json_decode",
+    "deserialize",
+    "total",
+)
+
+
+@attrs.define()
+class RequestTiming:
+    """Represents the timing of a single call, with every phase in seconds.
+
+    A phase is `None` when it did not happen, like `dns` and `connect` for a reused
+    connection or every network phase for a cached response.
+    """
+
+    endpoint: str
+    """The uri template of the endpoint route."""
+
+    method: str
+    """The http method of the request."""
+
+    uri: str
+    """The request uri."""
+
+    status: int | None = attrs.field(default=None)
+    """The HTTP status of the response."""
+
+    cached: bool = attrs.field(default=False)
+    """Whether the response was served from the cache."""
+
+    stale: bool = attrs.field(default=False)
+    """Whether the cached response was expired and served while being refreshed."""
+
+    coalesced: bool = attrs.field(default=False)
+    """Whether the call shared the in-flight request of another call, whose network phases it reports."""
+
+    queued: float | None = attrs.field(default=None)
+    """The time spent waiting for a free connection in the pool."""
+
+    dns: float | None = attrs.field(default=None)
+    """The time spent resolving the host."""
+
+    connect: float | None = attrs.field(default=None)
+    """The time spent opening a new connection, including the TLS handshake."""
+
+    ttfb: float | None = attrs.field(default=None)
+    """The time from sending the request headers to receiving the response headers."""
+
+    body_read: float | None = attrs.field(default=None)
+    """The time spent reading the response body."""
+
+    json_decode: float | None = attrs.field(default=None)
+    """The time spent decoding the JSON response body."""
+
+    deserialize: float | None = attrs.field(default=None)
+    """The time spent deserializing the JSON data into models."""
+
+    total: float = attrs.field(default=0.0)
+    """The total time of the call, from the service method to the deserialized models."""
+
+    started_at: float = attrs.field(factory=time.perf_counter, repr=False, eq=False)
+    """The `time.perf_counter` value at which the call started."""
+
+    def copy_network(self, other: RequestTiming) -> None:
+        """Copy the network phases and status of another timing, the one of a shared request."""
+
+        self.status = other.status
+        self.queued = other.queued
+        self.dns = other.dns
+        self.connect = other.connect
+        self.ttfb = other.ttfb
+        self.body_read = other.body_read
+        self.json_decode = other.json_decode
+
+
+class TimingStats:
+    """Rolling statistics of the calls to a single endpoint.
+
+    Args:
+        window: The number of most recent calls the statistics are computed over.
+    """
+
+    __slots__ = ("_records", "_count")
+
+    def __init__(self, window: int = 100) -> None:
+        self._records: deque[RequestTiming] = deque(maxlen=window)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """The number of calls recorded since the start."""
+
+        return self._count
+
+    @property
+    def records(self) -> tuple[RequestTiming, ...]:
+        """The timings of the most recent calls, oldest first."""
+
+        return tuple(self._records)
+
+    def add(self, timing: RequestTiming) -> None:
+        """Add the timing of a call."""
+
+        self._records.append(timing)
+        self._count += 1
+
+    def _values(self, phase: str) -> list[float]:
+        """Get the recorded values of a phase, skipping the calls it did not happen in."""
+
+        if phase not in _PHASES:
+            raise ValueError(f"Unknown phase {phase!r}.")
+
+        return [
+            value
+            for value in (getattr(timing, phase) for timing in self._records)
+            if value is not None
+        ]
+
+    def mean(self, phase: str = "total") -> float | None:
+        """Get the mean time of a phase over the window.
+
+        Args:
+            phase: The phase, one of the timing attributes of [`RequestTiming`][barch.RequestTiming].
+
+        Returns:
+            The mean in seconds, or `None` if the phase was not recorded.
+
+        Raises:
+            ValueError: When the phase is unknown.
+        """
+
+        values = self._values(phase)
+
+        return sum(values) / len(values) if values else None
+
+    def percentile(self, percentile: float, phase: str = "total") -> float | None:
+        """Get a percentile of the time of a phase over the window, like `95` for the p95.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+            phase: The phase, one of the timing attributes of [`RequestTiming`][barch.RequestTiming].
+
+        Returns:
+            The percentile in seconds, or `None` if the phase was not recorded.
+
+        Raises:
+            ValueError: When the phase is unknown.
+        """
+
+        values = sorted(self._values(phase))
+
+        if not values:
+            return None
+
+        return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+class Instrumentation:
+    """Records the timing of every call made through the HTTP service.
+
+    The network phases are recorded with an `aiohttp.TraceConfig`, which is added to the
+    session the HTTP service creates. When passing an existing session instead, add
+    [`trace_config`][barch.Instrumentation.trace_config] to its `trace_configs`.
+
+    Args:
+        on_timing: The optional hook called with the [`RequestTiming`][barch.RequestTiming]
+            of every finished call.
+        window: The number of most recent calls the per endpoint statistics are computed over.
+
+    ??? example
+
+        ```py
+        from barch import Client, Instrumentation
+
+        client = Client(instrumentation=Instrumentation(on_timing=print))
+
+        result = await client.character.get_character(id=10000)
+
+        timing = client.last_timing
+        stats = client.timings
+
+        await client.close()
+        ```
+    """
+
+    __slots__ = (
+        "_on_timing",
+        "_window",
+        "_stats",
+        "_trace_config",
+        "_pending",
+        "_last",
+    )
+
+    def __init__(
+        self,
+        on_timing: Callable[[RequestTiming], Any] | None = None,
+        window: int = 100,
+    ) -> None:
+        self._on_timing = on_timing
+        self._window = window
+        self._stats: dict[str, TimingStats] = {}
+        self._trace_config: aiohttp.TraceConfig | None = None
+        self._pending: contextvars.ContextVar[
+            RequestTiming | None
+        ] = contextvars.ContextVar("barch_pending_timing", default=None)
+        self._last: contextvars.ContextVar[
+            RequestTiming | None
+        ] = contextvars.ContextVar("barch_last_timing", default=None)
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """The trace config recording the network phases of the requests."""
+
+        if self._trace_config is None:
+            self._trace_config = self._create_trace_config()
+
+        return self._trace_config
+
+    @property
+    def stats(self) -> dict[str, TimingStats]:
+        """The rolling statistics of every endpoint, by endpoint uri template."""
+
+        return self._stats
+
+    @property
+    def last(self) -> RequestTiming | None:
+        """The timing of the last call finished in the current task."""
+
+        return self._last.get()
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create the trace config recording the network phases into the request timing."""
+
+        import aiohttp
+
+        trace_config = aiohttp.TraceConfig()
+
+        def start(name: str) -> Callable[..., Any]:
+            async def on_start(_: Any, context: SimpleNamespace, __: Any) -> None:
+                setattr(context, name, time.perf_counter())
+
+            return on_start
+
+        def end(name: str) -> Callable[..., Any]:
+            async def on_end(_: Any, context: SimpleNamespace, __: Any) -> None:
+                timing = context.trace_request_ctx
+                started_at = getattr(context, name, None)
+
+                if isinstance(timing, RequestTiming) and started_at is not None:
+                    setattr(timing, name, time.perf_counter() - started_at)
+
+            return on_end
+
+        trace_config.on_connection_queued_start.append(start("queued"))
+        trace_config.on_connection_queued_end.append(end("queued"))
+        trace_config.on_dns_resolvehost_start.append(start("dns"))
+        trace_config.on_dns_resolvehost_end.append(end("dns"))
+        trace_config.on_connection_create_start.append(start("connect"))
+        trace_config.on_connection_create_end.append(end("connect"))
+        trace_config.on_request_headers_sent.append(start("ttfb"))
+        trace_config.on_request_end.append(end("ttfb"))
+
+        return trace_config
+
+    def start(self, route: GenerateRoute) -> RequestTiming:
+        """Start the timing of a call, finishing the previous call of the current task if it
+        is still waiting for deserialization.
+
+        Args:
+            route: The route of the call.
+
+        Returns:
+            The timing of the call.
+        """
+
+        pending = self._pending.get()
+
+        if pending is not None:
+            self._pending.set(None)
+            self.finish(pending)
+
+        return RequestTiming(route.route.uri, route.method, route.uri)
+
+    def complete(
+        self, timing: RequestTiming, response: HttpSuccessResponse | HttpErrorResponse
+    ) -> None:
+        """Complete the HTTP part of a call. An error finishes the call right away, a success
+        waits for the service to deserialize the response, see [`take_pending`][barch.Instrumentation.take_pending].
+
+        Args:
+            timing: The timing of the call.
+            response: The response of the call.
+        """
+
+        timing.status = response.status
+
+        if isinstance(response, HttpErrorResponse):
+            self.finish(timing)
+
+        else:
+            self._pending.set(timing)
+
+    def take_pending(self) -> RequestTiming | None:
+        """Take the timing of the call of the current task waiting for deserialization.
+
+        Returns:
+            The timing, or `None` if there is none.
+        """
+
+        pending = self._pending.get()
+        self._pending.set(None)
+
+        return pending
+
+    def finish(self, timing: RequestTiming) -> None:
+        """Finish the timing of a call, adding it to its endpoint statistics and passing it
+        to the hook.
+
+        Args:
+            timing: The timing of the call.
+        """
+
+        timing.total = time.perf_counter() - timing.started_at
+        self._last.set(timing)
+
+        stats = self._stats.get(timing.endpoint)
+
+        if stats is None:
+            stats = self._stats[timing.endpoint] = TimingStats(self._window)
+
+        stats.add(timing)
+
+        if self._on_timing is not None:
+            self._on_timing(timing)
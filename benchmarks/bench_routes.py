@@ -0,0 +1,62 @@
+"""Micro-benchmark of route generation throughput under `asyncio.gather` load.
+
+Every task generates routes for its own character id and checks that the uri it gets
+back is its own, so a route leaking state between tasks fails the run.
+
+Run with `python benchmarks/bench_routes.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from barch import endpoints
+
+TASKS = 1000
+ROUTES_PER_TASK = 200
+
+
+async def generate(id: int) -> int:
+    """Generate routes for the given id, yielding to the event loop after each one."""
+
+    expected = f"{endpoints.CHARACTERURL}/{id}"
+
+    for _ in range(ROUTES_PER_TASK):
+        route = endpoints.GET_CHARACTER.generate_route(id).with_params({"id": "true"})
+
+        if route.uri != expected:
+            raise AssertionError(f"Task {id} got the uri {route.uri!r}.")
+
+        await asyncio.sleep(0)
+
+    return ROUTES_PER_TASK
+
+
+def generate_sync(count: int) -> float:
+    """Generate routes without an event loop and return the elapsed time."""
+
+    start = time.perf_counter()
+
+    for id in range(count):
+        endpoints.GET_CHARACTER.generate_route(id).with_params({"id": "true"})
+
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    count = TASKS * ROUTES_PER_TASK
+    elapsed = generate_sync(count)
+    print(f"sync:   {count} routes in {elapsed:.3f}s ({count / elapsed:,.0f} routes/s)")
+
+    start = time.perf_counter()
+    generated = sum(await asyncio.gather(*(generate(id) for id in range(TASKS))))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"gather: {generated} routes in {elapsed:.3f}s ({generated / elapsed:,.0f} routes/s)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""Benchmark of deserializing a full character roster payload.
+
+Compares the generated per-model deserializers of `Serializer` against a reference
+implementation of the previous reflective approach, which camel cased every attribute
+name and set it with `setattr` on every call.
+
+Run with `python benchmarks/bench_serializer.py`.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import timeit
+from typing import Any
+
+from barch import Serializer, Character, Terrain, TerrainDetails
+from barch.enums import Position, Role, Rarity
+
+ROUNDS = 200
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "characters.json"
+
+
+class ReflectiveSerializer:
+    """The previous reflective `Character` deserialization, kept as the baseline."""
+
+    def _to_camel_case(self, attr: str) -> str:
+        first, *rest = attr.split("_")
+        return "".join((first.lower(), *map(str.title, rest)))
+
+    def _set_attrs_cased(self, model: Any, data: dict[str, Any], *attrs: str) -> None:
+        if data:
+            for attr in attrs:
+                cased_attr = self._to_camel_case(attr)
+
+                if data.get(cased_attr) is not None:
+                    setattr(model, attr, data[cased_attr])
+                else:
+                    setattr(model, attr, None)
+
+    def _deserialize_terrain(self, data: dict[str, Any]) -> Terrain:
+        terrain = Terrain()
+
+        for name in ("urban", "outdoor", "indoor"):
+            details = data.get(name, {})
+            setattr(
+                terrain,
+                name,
+                TerrainDetails(
+                    details.get("DamageDealt", ""), details.get("ShieldBlockRate", "")
+                ),
+            )
+
+        return terrain
+
+    def deserialize_character(self, data: dict[str, Any]) -> Character:
+        character = Character()
+
+        character.position = Position.from_str(data.get("position", None))
+        character.role = Role.from_str(data.get("role", None))
+        character.rarity = Rarity.try_from_str(data.get("rarity", None))
+        character.terrain = self._deserialize_terrain(data.get("terrain", {}))
+
+        self._set_attrs_cased(
+            character,
+            data,
+            "id",
+            "name",
+            "profile",
+            "base_star",
+            "armor_type",
+            "bullet_type",
+            "weapon_type",
+            "squad_type",
+            "school",
+        )
+
+        return character
+
+
+def main() -> None:
+    roster = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    results = {}
+
+    for name, serializer in (
+        ("reflective", ReflectiveSerializer()),
+        ("generated", Serializer()),
+    ):
+        elapsed = min(
+            timeit.repeat(
+                lambda: [serializer.deserialize_character(data) for data in roster],
+                number=ROUNDS,
+                repeat=5,
+            )
+        )
+        results[name] = elapsed
+        print(f"{name:>10}: {len(roster) * ROUNDS / elapsed:,.0f} characters/s")
+
+    print(f"   speedup: {results['reflective'] / results['generated']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
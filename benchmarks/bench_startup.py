@@ -0,0 +1,127 @@
+"""Benchmark of the cold start of a short lived process using the client.
+
+Every sample runs in a fresh interpreter and measures `import barch`, importing and
+creating the `Client`, and the first request, which creates the session, against a local
+HTTP server serving the roster fixture, so no network access is needed.
+
+Run with `python benchmarks/bench_startup.py`, optionally with `--max-import-ms 50` to
+fail with exit status 1 when the median `import barch` time exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import threading
+
+SAMPLES = 10
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "characters.json"
+
+SAMPLE = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+import barch
+imported = time.perf_counter()
+from barch import Client
+client = Client()
+created = time.perf_counter()
+
+async def first_request():
+    route = barch.Route("GET", sys.argv[1]).generate_route()
+    response = await client._http.fetch(route)
+    assert response.status == 200, response
+    await client.close()
+
+asyncio.run(first_request())
+requested = time.perf_counter()
+
+print(json.dumps({
+    "import barch": imported - start,
+    "Client()": created - imported,
+    "first request": requested - created,
+    "total": requested - start,
+}))
+"""
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves the roster fixture on every path."""
+
+    def __init__(self, body: bytes, *args, **kwargs) -> None:
+        self.body = body
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _sample(url: str) -> dict[str, float]:
+    """Run a single cold start in a fresh interpreter."""
+
+    output = subprocess.run(
+        [sys.executable, "-c", SAMPLE, url], capture_output=True, check=True, text=True
+    ).stdout
+
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=SAMPLES)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        help="fail when the median import time exceeds this budget",
+    )
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(_Handler, FIXTURE.read_bytes())
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/buruaka/character"
+
+    try:
+        samples = [_sample(url) for _ in range(args.samples)]
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for phase in samples[0]:
+        values = [sample[phase] * 1000 for sample in samples]
+        print(
+            f"{phase:>14}: median {statistics.median(values):7.1f}ms"
+            f"  min {min(values):7.1f}ms  max {max(values):7.1f}ms"
+        )
+
+    median_import = statistics.median(sample["import barch"] for sample in samples)
+
+    if args.max_import_ms is not None and median_import * 1000 > args.max_import_ms:
+        print(
+            f"regression: import barch takes {median_import * 1000:.1f}ms,"
+            f" budget {args.max_import_ms:.1f}ms",
+            file=sys.stderr,
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
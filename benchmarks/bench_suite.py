@@ -0,0 +1,352 @@
+"""Offline micro-benchmark suite of the hot paths which run on every API call.
+
+Every case runs on the JSON fixtures in `benchmarks/fixtures`, without network access,
+and reports its throughput in operations per second along with the memory it allocates
+per operation, measured with `tracemalloc`.
+
+The results can be saved as a baseline and later runs compared against it, failing with
+exit status 1 when a case is slower, or allocates more, than the baseline by more than
+the threshold.
+
+Wall clock timings of a shared machine drift by tens of percent between runs, so the
+speed of every case is compared relative to a fixed calibration workload timed right
+before each of its runs, which cancels out how fast the machine is at the time. The
+relative speed is the median of many runs interleaved across the cases. When the spread
+between the runs of either side exceeds the threshold, a regression of that size can not
+be told apart from noise, so the comparison fails as inconclusive and should be run again
+with more runs.
+
+Run with:
+
+    python benchmarks/bench_suite.py --save baseline.json
+    python benchmarks/bench_suite.py --compare baseline.json --threshold 0.3
+    python benchmarks/bench_suite.py --compare baseline.json --repeat 45
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from barch import (
+    Serializer,
+    CharacterTable,
+    Success,
+    Error,
+    HttpErrorResponse,
+    endpoints,
+)
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+REPEAT = 15
+"""The default number of timing runs of every case, the median one is kept."""
+
+MIN_TIME = 0.05
+"""The minimum duration in seconds of a single timing run."""
+
+THRESHOLD = 0.25
+"""The default allowed relative regression."""
+
+
+def _load(name: str) -> Any:
+    """Load a JSON fixture."""
+
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def _cases() -> dict[str, Callable[[], Any]]:
+    """Build the benchmark cases, each a function doing a single operation."""
+
+    roster = _load("characters.json")
+    details = _load("character_details.json")
+    raids = _load("raids.json")
+    serializer = Serializer()
+    lazy_serializer = Serializer(lazy=True)
+    error = HttpErrorResponse(404, "Not found.")
+
+    def deserialize_character() -> Any:
+        return [serializer.deserialize_character(data) for data in roster]
+
+    def character_table() -> Any:
+        return CharacterTable.from_payload(roster)
+
+    def deserialize_character_details() -> Any:
+        return [serializer.deserialize_character_details(data) for data in details]
+
+    def deserialize_character_details_lazy() -> Any:
+        return [lazy_serializer.deserialize_character_details(data) for data in details]
+
+    def deserialize_raids() -> Any:
+        return serializer.deserialize_raids(raids)
+
+    def generate_route() -> Any:
+        return endpoints.GET_CHARACTER.generate_route(10000).with_params({"id": "true"})
+
+    def generate_route_query() -> Any:
+        return endpoints.GET_CHARACTER_QUERY.generate_route().with_params(
+            {"role": "Dealer", "position": "Back", "school": "Gehenna"}
+        )
+
+    def result_success() -> Any:
+        return Success(roster)
+
+    def result_error() -> Any:
+        return Error(error)
+
+    return {
+        "deserialize_character[roster]": deserialize_character,
+        "character_table[roster]": character_table,
+        "deserialize_character_details[20]": deserialize_character_details,
+        "deserialize_character_details_lazy[20]": deserialize_character_details_lazy,
+        "deserialize_raids": deserialize_raids,
+        "generate_route": generate_route,
+        "generate_route_query": generate_route_query,
+        "result_success": result_success,
+        "result_error": result_error,
+    }
+
+
+def _calibration() -> Any:
+    """A fixed pure Python workload, timed to measure how fast the machine is at the time."""
+
+    return sorted([str(i) for i in range(100)], key=len)
+
+
+def _timer(case: Callable[[], Any]) -> tuple[timeit.Timer, int]:
+    """Create the timer of a case with the number of operations of a single run."""
+
+    timer = timeit.Timer(case)
+    number, elapsed = timer.autorange()
+
+    return timer, max(number, int(number * MIN_TIME / elapsed))
+
+
+def _measure_speed(
+    cases: dict[str, Callable[[], Any]], repeat: int
+) -> dict[str, tuple[float, float, float]]:
+    """Measure the throughput of the cases, running them in turns so the drift of the
+    machine speed affects them alike.
+
+    Args:
+        cases: The cases to measure, by name.
+        repeat: The number of timing runs of every case.
+
+    Returns:
+        The operations per second of the median run, the median speed relative to the
+        calibration workload and the spread of the relative speeds, their interquartile
+        range relative to the median, by name.
+    """
+
+    calibration, calibration_number = _timer(_calibration)
+    timers = {name: _timer(case) for name, case in cases.items()}
+    ops: dict[str, list[float]] = {name: [] for name in cases}
+    relative: dict[str, list[float]] = {name: [] for name in cases}
+
+    for _ in range(repeat):
+        for name, (timer, number) in timers.items():
+            calibration_ops = calibration_number / calibration.timeit(
+                calibration_number
+            )
+            ops[name].append(number / timer.timeit(number))
+            relative[name].append(ops[name][-1] / calibration_ops)
+
+    results = {}
+
+    for name in cases:
+        median = statistics.median(relative[name])
+        low, _, high = statistics.quantiles(relative[name], n=4)
+        results[name] = (statistics.median(ops[name]), median, (high - low) / median)
+
+    return results
+
+
+def _measure_memory(case: Callable[[], Any]) -> tuple[int, int]:
+    """Measure the memory a single operation of a case allocates.
+
+    Returns:
+        The peak number of bytes allocated during the operation and the number of memory
+        blocks still held by its result.
+    """
+
+    case()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        result = case()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+
+    finally:
+        tracemalloc.stop()
+
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    blocks = sum(
+        stat.count_diff
+        for stat in after.filter_traces(ignore).compare_to(
+            before.filter_traces(ignore), "filename"
+        )
+        if stat.count_diff > 0
+    )
+    del result
+
+    return peak - current, blocks
+
+
+def run(
+    selected: list[str] | None = None, repeat: int = REPEAT
+) -> dict[str, dict[str, float]]:
+    """Run the benchmark cases.
+
+    Args:
+        selected: The optional substrings of the names of the cases to run, all by default.
+        repeat: The number of timing runs of every case.
+
+    Returns:
+        The `ops_per_sec`, `relative_speed`, `spread`, `peak_bytes` and `blocks` of every
+        case run, by name.
+    """
+
+    cases = {
+        name: case
+        for name, case in _cases().items()
+        if not selected or any(part in name for part in selected)
+    }
+    results = {}
+
+    for name, (ops, relative, spread) in _measure_speed(cases, repeat).items():
+        peak, blocks = _measure_memory(cases[name])
+        results[name] = {
+            "ops_per_sec": ops,
+            "relative_speed": relative,
+            "spread": spread,
+            "peak_bytes": peak,
+            "blocks": blocks,
+        }
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Compare results against a baseline.
+
+    The speeds relative to the calibration workload are compared. A slowdown larger than
+    the threshold is a regression. A case whose runs, on either side, spread wider than
+    the threshold can not be judged and is reported as a failure too, the threshold is
+    never widened to the noise.
+
+    Args:
+        results: The results of the current run.
+        baseline: The results of the baseline run.
+        threshold: The allowed relative regression, like `0.25` for 25%.
+
+    Returns:
+        The description of every regression and inconclusive case.
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        base = baseline.get(name)
+
+        if base is None:
+            continue
+
+        if "relative_speed" not in base:
+            continue
+
+        noise = max(result["spread"], base["spread"])
+        change = result["relative_speed"] / base["relative_speed"] - 1
+
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {change:+.1%} relative speed, {result['ops_per_sec']:,.0f} ops/s,"
+                f" baseline {base['ops_per_sec']:,.0f} ops/s, allowed {threshold:.0%}"
+            )
+
+        elif noise > threshold:
+            regressions.append(
+                f"{name}: inconclusive, {noise:.1%} spread exceeds the {threshold:.0%}"
+                f" threshold, run again with a higher --repeat"
+            )
+
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{name}: {result['peak_bytes']:,} bytes peak, baseline {base['peak_bytes']:,} bytes"
+            )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", help="substrings of the cases to run")
+    parser.add_argument(
+        "--save", type=pathlib.Path, help="save the results as a baseline"
+    )
+    parser.add_argument("--compare", type=pathlib.Path, help="compare with a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"the allowed relative regression (default: {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=REPEAT,
+        help=f"the number of timing runs of every case (default: {REPEAT})",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 4:
+        parser.error("--repeat must be at least 4")
+
+    results = run(args.cases, args.repeat)
+    baseline = (
+        json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else {}
+    )
+
+    print(
+        f"{'case':<40} {'ops/s':>14} {'spread':>8} {'peak bytes':>12} {'blocks':>8}"
+        f" {'change':>8}"
+    )
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        change = (
+            f"{result['relative_speed'] / base['relative_speed'] - 1:+.1%}"
+            if base and "relative_speed" in base
+            else ""
+        )
+        print(
+            f"{name:<40} {result['ops_per_sec']:>14,.0f} {result['spread']:>8.1%}"
+            f" {result['peak_bytes']:>12,} {result['blocks']:>8,} {change:>8}"
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    regressions = compare(results, baseline, args.threshold)
+
+    for regression in regressions:
+        print(f"failed: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Fixtures of the tests, a local BlueArchive API served by `aiohttp`."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import hashlib
+import inspect
+import json
+import pathlib
+import threading
+from typing import Any, Iterator
+
+import pytest
+from aiohttp import web
+
+from barch import endpoints
+from barch.models import Route
+
+FIXTURES = pathlib.Path(__file__).parents[1] / "benchmarks" / "fixtures"
+
+
+def _load(name: str) -> Any:
+    """Load a JSON fixture."""
+
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+class FakeApi:
+    """A local BlueArchive API serving the benchmark fixtures.
+
+    The JP roster has every character with details, the EN roster all of them but the last
+    two. Every response has an `ETag` and a matching `If-None-Match` is answered with `304`.
+    """
+
+    def __init__(self) -> None:
+        self.details: dict[int, dict[str, Any]] = {
+            character["id"]: character for character in _load("character_details.json")
+        }
+        roster = [
+            character
+            for character in _load("characters.json")
+            if character["id"] in self.details
+        ]
+        self.rosters: dict[bool, list[dict[str, Any]]] = {
+            False: roster[:-2],
+            True: roster,
+        }
+        self.raids: dict[str, Any] = _load("raids.json")
+
+        self.delay = 0.0
+        """The time in seconds every request takes."""
+
+        self.hits: collections.Counter[str] = collections.Counter()
+        """The number of requests by path and query."""
+
+        self.not_modified = 0
+        """The number of `304` responses."""
+
+        self.failures: dict[
+            str, list[tuple[int, dict[str, str]]]
+        ] = collections.defaultdict(list)
+        """The status and headers of the next failed responses by path and query."""
+
+    def _get_data(self, request: web.Request) -> Any:
+        is_jp = request.query.get("region") == "japan"
+        path = request.path.removeprefix("/buruaka")
+
+        if path == "/character":
+            return self.rosters[is_jp]
+
+        if path == "/raid":
+            return self.raids
+
+        if path.startswith("/character/"):
+            ids = {character["id"] for character in self.rosters[is_jp]}
+            name = path.removeprefix("/character/")
+
+            for id in ids:
+                details = self.details[id]
+
+                if str(id) == name or details["character"]["name"] == name:
+                    return details
+
+        return None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.hits[request.path_qs] += 1
+
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        failures = self.failures.get(request.path_qs)
+
+        if failures:
+            status, headers = failures.pop(0)
+            return web.json_response(
+                {"error": "failed"}, status=status, headers=headers
+            )
+
+        data = self._get_data(request)
+
+        if data is None:
+            return web.json_response({"error": "not found"}, status=404)
+
+        body = json.dumps(data).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeApi]:
+    """Serve a `FakeApi` on a background thread and point the endpoints to it."""
+
+    fake = FakeApi()
+    app = web.Application()
+    app.router.add_get("/buruaka/{path:.*}", fake.handle)
+    runner = web.AppRunner(app, access_log=None)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", 0).start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    base = f"http://127.0.0.1:{runner.addresses[0][1]}/buruaka"
+    ttls = {}
+
+    for name, route in list(vars(endpoints).items()):
+        if isinstance(route, Route):
+            local = Route(route.method, route.uri.replace(endpoints.BASEURL, base))
+            monkeypatch.setattr(endpoints, name, local)
+
+            if route in endpoints.DEFAULT_TTLS:
+                ttls[local] = endpoints.DEFAULT_TTLS[route]
+
+    monkeypatch.setattr(endpoints, "DEFAULT_TTLS", ttls)
+
+    try:
+        yield fake
+
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run the coroutine tests in a new event loop."""
+
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+
+    arguments = {
+        name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames
+    }
+    asyncio.run(pyfuncitem.obj(**arguments))
+
+    return True
@@ -0,0 +1,277 @@
+"""Tests of the request handling of the client against a local API: coalescing, caching,
+retries and rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from barch import (
+    Client,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    SharedCache,
+    SQLiteCache,
+    endpoints,
+)
+
+from .conftest import FakeApi
+
+ROSTER = "/buruaka/character"
+RAIDS = "/buruaka/raid"
+
+
+def _character(id: int) -> str:
+    """The path and query of the EN character details by id."""
+
+    return f"/buruaka/character/{id}?id=true"
+
+
+def _http_date(delta: timedelta) -> str:
+    """Format a time relative to now as an HTTP date with a `-0000` zone."""
+
+    return format_datetime(datetime.now(timezone.utc) + delta).replace("+0000", "-0000")
+
+
+async def test_concurrent_calls_share_one_request(api: FakeApi) -> None:
+    api.delay = 0.1
+    client = Client()
+
+    results = await asyncio.gather(
+        *(client.character.get_all_characters() for _ in range(10))
+    )
+
+    assert all(result.is_success for result in results)
+    assert api.hits[ROSTER] == 1
+    assert results[0].value == results[9].value
+
+    await client.close()
+
+
+async def test_cache_serves_fresh_responses(api: FakeApi) -> None:
+    cache = ResponseCache()
+    client = Client(cache=cache)
+
+    first = await client.character.get_all_characters()
+    second = await client.character.get_all_characters()
+
+    assert first.value == second.value
+    assert api.hits[ROSTER] == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    await client.close()
+
+
+async def test_expired_response_is_revalidated(api: FakeApi) -> None:
+    client = Client(cache=ResponseCache(ttls={endpoints.GET_ALL_CHARACTERS: 0.05}))
+
+    first = await client.character.get_all_characters()
+    await asyncio.sleep(0.1)
+    second = await client.character.get_all_characters()
+
+    assert second.is_success
+    assert first.value == second.value
+    assert api.hits[ROSTER] == 2
+    assert api.not_modified == 1
+
+    await client.close()
+
+
+async def test_sqlite_cache_persists_responses(api: FakeApi, tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+
+    for _ in range(2):
+        cache = SQLiteCache(path)
+        client = Client(cache=cache)
+
+        result = await client.character.get_all_characters()
+
+        assert result.is_success
+        assert len(result.value) == len(api.rosters[False])
+
+        await client.close()
+        cache.close()
+
+    assert api.hits[ROSTER] == 1
+
+
+async def test_sqlite_cache_evicts_oldest_responses(api: FakeApi, tmp_path) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", max_size=2)
+    client = Client(cache=cache)
+
+    for id in (10000, 10001, 10002):
+        assert (await client.character.get_character(id=id)).is_success
+
+    assert cache.size == 2
+    assert (await client.character.get_character(id=10002)).is_success
+    assert (await client.character.get_character(id=10000)).is_success
+    assert api.hits[_character(10002)] == 1
+    assert api.hits[_character(10000)] == 2
+
+    await client.close()
+    cache.close()
+
+
+async def test_failed_request_is_retried(api: FakeApi) -> None:
+    api.failures[RAIDS] = [(502, {}), (503, {})]
+    client = Client(retry=RetryPolicy(base_delay=0.01))
+
+    result = await client.raid.get_raids()
+
+    assert result.is_success
+    assert api.hits[RAIDS] == 3
+
+    await client.close()
+
+
+async def test_retry_waits_for_retry_after(api: FakeApi) -> None:
+    api.failures[RAIDS] = [(429, {"Retry-After": "0.2"})]
+    client = Client(retry=RetryPolicy(base_delay=0.0, jitter=False))
+
+    start = time.perf_counter()
+    result = await client.raid.get_raids()
+
+    assert result.is_success
+    assert api.hits[RAIDS] == 2
+    assert time.perf_counter() - start >= 0.2
+
+    await client.close()
+
+
+async def test_retry_after_date_in_utc(api: FakeApi) -> None:
+    # a past date is retried right away instead of after the backoff delay
+    api.failures[RAIDS] = [(503, {"Retry-After": _http_date(-timedelta(minutes=1))})]
+    client = Client(retry=RetryPolicy(base_delay=5.0, jitter=False))
+
+    start = time.perf_counter()
+    result = await client.raid.get_raids()
+
+    assert result.is_success
+    assert time.perf_counter() - start < 1.0
+
+    await client.close()
+
+
+async def test_retry_after_longer_than_max_delay(api: FakeApi) -> None:
+    api.failures[RAIDS] = [(429, {"Retry-After": _http_date(timedelta(minutes=10))})]
+    client = Client(retry=RetryPolicy(max_delay=30.0))
+
+    result = await client.raid.get_raids()
+
+    assert result.is_error
+    assert result.error.status == 429
+    assert api.hits[RAIDS] == 1
+
+    await client.close()
+
+
+async def test_invalid_retry_after_uses_backoff(api: FakeApi) -> None:
+    api.failures[RAIDS] = [(429, {"Retry-After": "soon"})]
+    client = Client(retry=RetryPolicy(base_delay=0.01))
+
+    result = await client.raid.get_raids()
+
+    assert result.is_success
+    assert api.hits[RAIDS] == 2
+
+    await client.close()
+
+
+async def test_rate_limiter_spaces_requests(api: FakeApi) -> None:
+    client = Client(rate_limiter=RateLimiter(rate=20, capacity=1))
+
+    start = time.perf_counter()
+
+    for id in (10000, 10001, 10002):
+        assert (await client.character.get_character(id=id)).is_success
+
+    assert time.perf_counter() - start >= 0.09
+
+    await client.close()
+
+
+async def test_non_blocking_rate_limiter_is_not_retried(api: FakeApi) -> None:
+    client = Client(
+        retry=RetryPolicy(base_delay=0.5, jitter=False),
+        rate_limiter=RateLimiter(rate=1, capacity=1, block=False),
+    )
+
+    assert (await client.character.get_character(id=10000)).is_success
+
+    start = time.perf_counter()
+    result = await client.character.get_character(id=10001)
+
+    assert result.is_error
+    assert result.error.status == 429
+    assert api.hits[_character(10001)] == 0
+    assert time.perf_counter() - start < 0.25
+
+    await client.close()
+
+
+async def test_stale_response_is_served_while_refreshed(api: FakeApi) -> None:
+    cache = ResponseCache(ttls={endpoints.GET_ALL_CHARACTERS: 0.05}, max_stale=60.0)
+    client = Client(cache=cache)
+
+    await client.character.get_all_characters()
+    await asyncio.sleep(0.1)
+    api.delay = 0.2
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.character.get_all_characters() for _ in range(3))
+    )
+
+    assert all(result.is_success for result in results)
+    assert time.perf_counter() - start < 0.15
+    assert cache.stale_hits == 3
+
+    await asyncio.sleep(0.3)
+
+    assert api.hits[ROSTER] == 2
+    assert (await client.character.get_all_characters()).is_success
+    assert api.hits[ROSTER] == 2
+
+    await client.close()
+
+
+async def test_shared_cache_refreshes_once(api: FakeApi, tmp_path) -> None:
+    api.delay = 0.2
+    caches = [SharedCache(tmp_path / "shared.sqlite3") for _ in range(4)]
+    clients = [Client(cache=cache) for cache in caches]
+
+    results = await asyncio.gather(
+        *(client.character.get_all_characters() for client in clients)
+    )
+
+    assert all(result.is_success for result in results)
+    assert api.hits[ROSTER] == 1
+
+    for client, cache in zip(clients, caches):
+        await client.close()
+        cache.close()
+
+
+async def test_shared_cache_lease_expires(api: FakeApi, tmp_path) -> None:
+    path = tmp_path / "shared.sqlite3"
+    holder = SharedCache(path, lease_timeout=0.2)
+    cache = SharedCache(path)
+    client = Client(cache=cache)
+    key = endpoints.GET_ALL_CHARACTERS.generate_route().key
+
+    # a process which died while refreshing the roster
+    assert holder.acquire_lease(key)
+
+    start = time.perf_counter()
+    result = await client.character.get_all_characters()
+
+    assert result.is_success
+    assert time.perf_counter() - start >= 0.15
+    assert api.hits[ROSTER] == 1
+
+    await client.close()
+    cache.close()
+    holder.close()
@@ -0,0 +1,102 @@
+"""Tests of the incremental JSON array decoder used to stream the roster."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import Any
+
+import pytest
+
+from barch.services.http import _JsonArrayDecoder
+
+ROSTER = (
+    pathlib.Path(__file__).parent.parent / "benchmarks" / "fixtures" / "characters.json"
+)
+
+TRICKY = [
+    {"name": "ホシノ", "school": "アビドス高等学校", "emoji": "🌸"},
+    "a string with ] and , and [ inside",
+    'escaped \\" quote ] and a backslash \\\\',
+    [1, [2, [3]], {"]": ","}],
+    -12.5e3,
+    123456789,
+    True,
+    False,
+    None,
+    "",
+    {},
+    [],
+]
+
+
+def _decode(body: bytes, sizes: list[int]) -> list[Any]:
+    """Decode a body fed in chunks of the given sizes, repeated until the body ends."""
+
+    decoder = _JsonArrayDecoder()
+    items: list[Any] = []
+    pos = 0
+    index = 0
+
+    while pos < len(body):
+        size = sizes[index % len(sizes)]
+        items.extend(decoder.feed(body[pos : pos + size]))
+        pos += size
+        index += 1
+
+    decoder.close()
+
+    return items
+
+
+@pytest.mark.parametrize("sizes", [[1], [2], [3, 1, 7], [64], [1 << 20]])
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": ")])
+def test_tricky_elements(sizes: list[int], separators: tuple[str, str]) -> None:
+    body = json.dumps(TRICKY, ensure_ascii=False, separators=separators).encode()
+
+    assert _decode(b"\n " + body + b" \n", sizes) == TRICKY
+
+
+@pytest.mark.parametrize("sizes", [[1], [5, 13, 1], [4096]])
+def test_roster_fixture(sizes: list[int]) -> None:
+    body = ROSTER.read_bytes()
+
+    assert _decode(body, sizes) == json.loads(body)
+
+
+@pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[\n]"])
+def test_empty_array(body: bytes) -> None:
+    assert _decode(body, [1]) == []
+
+
+def test_number_split_across_chunks() -> None:
+    decoder = _JsonArrayDecoder()
+
+    assert decoder.feed(b"[12") == []
+    assert decoder.feed(b"34") == []
+    assert decoder.feed(b",5") == [1234]
+    assert decoder.feed(b"]") == [5]
+
+    decoder.close()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"[1,,2]", b"[,1]", b"[1,]", b"[1 2]", b'[{"a": 1} {"b": 2}]', b"[,]"],
+)
+@pytest.mark.parametrize("sizes", [[1], [1 << 20]])
+def test_malformed_array(body: bytes, sizes: list[int]) -> None:
+    with pytest.raises(ValueError, match="Malformed"):
+        _decode(body, sizes)
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1}', b"1", b'"[1]"'])
+def test_not_an_array(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        _decode(body, [1])
+
+
+@pytest.mark.parametrize("body", [b"[1, 2", b"[1,", b"[", b'["unterminated'])
+def test_incomplete_array(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Incomplete"):
+        _decode(body, [1])
@@ -0,0 +1,37 @@
+"""Tests of the lazy exports of the package."""
+
+from __future__ import annotations
+
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import barch
+
+SUBMODULES = sorted(module.name for module in pkgutil.iter_modules(barch.__path__))
+
+
+def _run(code: str) -> None:
+    """Run code in a fresh interpreter, where no submodule is imported yet."""
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("name", SUBMODULES)
+def test_submodule_attribute(name: str) -> None:
+    _run(
+        "import barch, types\n"
+        f"assert isinstance(barch.{name}, types.ModuleType)\n"
+        f"assert barch.{name}.__name__ == 'barch.{name}'"
+    )
+
+
+def test_exports() -> None:
+    _run("import barch\n" "for name in barch.__all__:\n" "    getattr(barch, name)")
+
+
+def test_missing_attribute() -> None:
+    with pytest.raises(AttributeError):
+        barch.does_not_exist
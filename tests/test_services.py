@@ -0,0 +1,240 @@
+"""Tests of the service methods and the warmup of the client against a local API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from barch import (
+    Character,
+    CharacterTable,
+    Client,
+    LazyCharacterDetails,
+    ResponseCache,
+)
+
+from .conftest import FakeApi
+
+RAIDS = "/buruaka/raid"
+
+
+def _raid(start: float, settle: float, end: float) -> dict[str, int]:
+    """A raid of the raids payload, with its times in seconds relative to now."""
+
+    now = time.time()
+
+    return {
+        "seasonId": 1,
+        "bossName": "Binah",
+        "startAt": int((now + start) * 1000),
+        "settleAt": int((now + settle) * 1000),
+        "endAt": int((now + end) * 1000),
+    }
+
+
+async def test_raids_expire_at_next_transition(api: FakeApi) -> None:
+    api.raids = {"current": [_raid(-60, 0.2, 600)], "upcoming": [], "ended": []}
+    client = Client(cache=ResponseCache())
+
+    assert (await client.raid.get_raids()).is_success
+    assert (await client.raid.get_raids()).is_success
+    assert api.hits[RAIDS] == 1
+
+    await asyncio.sleep(0.3)
+
+    assert (await client.raid.get_raids()).is_success
+    assert api.hits[RAIDS] == 2
+
+    await client.close()
+
+
+async def test_raids_without_transition_use_route_ttl(api: FakeApi) -> None:
+    api.raids = {"current": [], "upcoming": [], "ended": [_raid(-600, -300, -60)]}
+    client = Client(cache=ResponseCache())
+
+    for _ in range(3):
+        assert (await client.raid.get_raids()).is_success
+
+    assert api.hits[RAIDS] == 1
+
+    await client.close()
+
+
+async def test_cached_raids_are_copied(api: FakeApi) -> None:
+    api.raids = {
+        "current": [_raid(-60, 600, 900), _raid(-120, 300, 600)],
+        "upcoming": [],
+        "ended": [],
+    }
+    client = Client(cache=ResponseCache())
+
+    first = (await client.raid.get_raids()).value
+    first.current.sort(key=lambda raid: raid.settle_at)
+    first.upcoming.append(first.current[0])
+    second = (await client.raid.get_raids()).value
+
+    assert [raid.settle_at for raid in second.current] == [
+        raid.settle_at for raid in reversed(first.current)
+    ]
+    assert second.upcoming == []
+    assert api.hits[RAIDS] == 1
+
+    await client.close()
+
+
+async def test_character_index_matches_roster(api: FakeApi) -> None:
+    client = Client()
+
+    result = await client.character.get_character_index()
+
+    assert result.is_success
+    assert [character.id for character in result.value.query(role="Dealer")] == [
+        character["id"]
+        for character in api.rosters[False]
+        if character["role"] == "Dealer"
+    ]
+
+    await client.close()
+
+
+async def test_character_table_matches_roster(api: FakeApi) -> None:
+    client = Client(cache=ResponseCache())
+
+    result = await client.character.get_character_table()
+
+    assert result.is_success
+    table = result.value
+    assert table.column("id") == [character["id"] for character in api.rosters[False]]
+    assert table.column("is_released") == [
+        character["isReleased"] for character in api.rosters[False]
+    ]
+    assert table.filter(school="SRT").column("id") == [
+        character["id"]
+        for character in api.rosters[False]
+        if character["school"] == "SRT"
+    ]
+
+    await client.close()
+
+
+async def test_cached_response_keeps_models_per_kind(api: FakeApi) -> None:
+    client = Client(cache=ResponseCache())
+
+    characters = await client.character.get_all_characters()
+    table = await client.character.get_character_table()
+    again = await client.character.get_all_characters()
+
+    assert isinstance(table.value, CharacterTable)
+    assert all(isinstance(character, Character) for character in again.value)
+    assert again.value == characters.value
+    assert again.value is not characters.value
+    assert (await client.character.get_character_table()).value is table.value
+    assert api.hits["/buruaka/character"] == 1
+
+    await client.close()
+
+
+async def test_lazy_character_details_equal_eager(api: FakeApi) -> None:
+    eager, lazy = Client(), Client(lazy=True)
+
+    first = (await eager.character.get_character(id=10000)).value
+    second = (await lazy.character.get_character(id=10000)).value
+    other = (await lazy.character.get_character(id=10001)).value
+
+    assert isinstance(second, LazyCharacterDetails)
+    assert first == second and second == first
+    assert second != other and other != first
+
+    await eager.close()
+    await lazy.close()
+
+
+async def test_all_characters_bilingual(api: FakeApi) -> None:
+    client = Client()
+
+    result = await client.character.get_all_characters_bilingual()
+
+    assert result.is_success
+    assert [character.id for character in result.value] == [
+        character["id"] for character in api.rosters[True]
+    ]
+
+    en_only, jp_only = result.value[0], result.value[-1]
+
+    assert en_only.is_released_en and en_only.is_released_jp
+    assert en_only.en.name == en_only.jp.name
+    assert jp_only.en is None
+    assert not jp_only.is_released_en and jp_only.is_released_jp
+
+    await client.close()
+
+
+async def test_character_bilingual(api: FakeApi) -> None:
+    client = Client()
+    jp_only = api.rosters[True][-1]["id"]
+
+    both = await client.character.get_character_bilingual(10000)
+    jp = await client.character.get_character_bilingual(jp_only)
+    missing = await client.character.get_character_bilingual(1)
+
+    assert both.is_success
+    assert both.value.en.id == both.value.jp.id == 10000
+    assert jp.is_success
+    assert jp.value.en is None and jp.value.jp.id == jp_only
+    assert missing.is_error
+    assert missing.error.status == 404
+
+    await client.close()
+
+
+async def test_character_bilingual_requires_id(api: FakeApi) -> None:
+    client = Client()
+
+    with pytest.raises(TypeError, match="id"):
+        await client.character.get_character_bilingual()
+
+    await client.close()
+
+
+async def test_warmup_fills_cache(api: FakeApi) -> None:
+    client = Client(cache=ResponseCache())
+    reports = []
+
+    report = await client.warmup(
+        concurrency=4, on_progress=lambda r: reports.append(r.done)
+    )
+    total = 4 + len(api.rosters[False]) + len(api.rosters[True])
+
+    assert (report.total, report.fetched, report.failed) == (total, total, 0)
+    assert report.is_complete
+    assert reports == list(range(1, total + 1))
+
+    hits = sum(api.hits.values())
+
+    assert (await client.character.get_character(id=10000)).is_success
+    assert (await client.character.get_character_jp(id=10000)).is_success
+    assert (await client.raid.get_raids_jp()).is_success
+    assert sum(api.hits.values()) == hits
+
+    await client.close()
+
+
+async def test_warmup_resumes_after_budget(api: FakeApi) -> None:
+    api.delay = 0.05
+    client = Client(cache=ResponseCache())
+
+    first = await client.warmup(concurrency=2, budget=0.2)
+
+    assert not first.is_complete
+    assert first.remaining > 0
+
+    api.delay = 0.0
+    second = await client.warmup()
+
+    assert second.is_complete
+    assert second.skipped > 0
+    assert second.fetched == second.total - second.skipped
+
+    await client.close()